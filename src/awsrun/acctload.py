@@ -53,9 +53,12 @@ import logging
 import re
 import shutil
 import subprocess
+import sys
 import tempfile
 from collections import defaultdict
+from contextlib import suppress
 from functools import reduce
+from operator import itemgetter
 from pathlib import Path
 
 import requests
@@ -65,6 +68,13 @@ from requests_file import FileAdapter
 
 from awsrun.cache import PersistentExpiringValue
 
+# Use the libyaml-based loader when PyYAML was built with it as it is
+# considerably faster than the pure-Python implementation.
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 LOG = logging.getLogger(__name__)
 
 
@@ -323,6 +333,7 @@ class MetaAccountLoader(AccountLoader):
         )  # pylint: disable=protected-access
 
         self.accts, self.attrs = self._parse(accts)
+        self._index = {}
         LOG.info(
             "loaded %d accounts with the metadata attributes: %s",
             len(self.accts),
@@ -359,10 +370,12 @@ class MetaAccountLoader(AccountLoader):
             assert attrs['status'] == {'active', 'suspended'}
             assert attrs['id'] == {'100200300400', '200300400100', '300400100200'}
         """
+        # Every account dict has the same keys (see _filter_attribute_names),
+        # so each attribute's values can be gathered as a column in a single
+        # pass over the accounts rather than visiting every item of every dict.
         d = defaultdict(set)
-        for acct in self.accts:
-            for attr, value in acct.items():
-                d[attr].add(value)
+        for attr in self.attrs:
+            d[attr] = set(map(itemgetter(attr), self.accts))
         return d
 
     def accounts(self, acct_ids=None, include=None, exclude=None):
@@ -413,11 +426,13 @@ class MetaAccountLoader(AccountLoader):
         `include` is not set, then all accounts are matched. Likewise, if
         `exclude` is not set, then no accounts are excluded.
         """
-        accts = self.accts
         acct_ids = [] if acct_ids is None else acct_ids
         include = {} if include is None else include
         exclude = {} if exclude is None else exclude
 
+        # Positions of the selected account dicts within self.accts
+        positions = range(len(self.accts))
+
         # Limit our account list to the requested IDs
         if acct_ids:
             requested = set(acct_ids)
@@ -427,7 +442,9 @@ class MetaAccountLoader(AccountLoader):
             if missing_acct_ids:
                 raise AccountsNotFoundError(list(missing_acct_ids))
 
-            accts = (a for a in self.accts if a[self.id_attr] in requested)
+            positions = [
+                i for i, a in enumerate(self.accts) if a[self.id_attr] in requested
+            ]
 
         # Make sure the filters contain valid attribute names
         for attr in itertools.chain(include.keys(), exclude.keys()):
@@ -435,13 +452,14 @@ class MetaAccountLoader(AccountLoader):
                 raise AttributeError(f"Invalid attribute '{attr}' in filter")
 
         # Limit our account list by the user-supplied filters
-        return [
-            self.CustomAccount(a) for a in accts if self._filter(a, include, exclude)
-        ]
+        if include or exclude:
+            selected = self._select(include, exclude)
+            positions = [i for i in positions if i in selected]
 
-    @staticmethod
-    def _filter(acct, include, exclude):
-        """Filter accounts based on `include` and `exclude` dicts.
+        return [self.CustomAccount(self.accts[i]) for i in positions]
+
+    def _select(self, include, exclude):
+        """Returns the set of positions of accounts matching `include` and `exclude`.
 
         The `include` filter is applied first, followed by the `exclude` filter.
         If a filter has multiple keys, then *each* key must match. A key matches
@@ -450,20 +468,51 @@ class MetaAccountLoader(AccountLoader):
         then no accounts are excluded.
         """
 
-        # This internal representation of an account is a dict here, not the
-        # same as the account object that is created via `MetaAccountLoader`
-        # which is why we used dict notation when accessing the account.
-        def test(dictionary, default):
-            if not dictionary:
-                return default
-            return all(
-                any(acct[attr] == v for v in values)
-                for attr, values in dictionary.items()
+        def matching(filters):
+            return reduce(
+                set.intersection,
+                (self._matching(attr, values) for attr, values in filters.items()),
             )
 
-        included = test(include, True)
-        excluded = test(exclude, False)
-        return included and not excluded
+        selected = matching(include) if include else set(range(len(self.accts)))
+        if exclude:
+            selected -= matching(exclude)
+        return selected
+
+    def _matching(self, attr, values):
+        """Returns a new set of positions of accounts where `attr` is in `values`."""
+        index, unhashable = self._attr_index(attr)
+
+        matched = set()
+        for value in values:
+            # An unhashable value, such as a list, cannot be in the index. It
+            # is compared directly against the unhashable account values below.
+            with suppress(TypeError):
+                matched.update(index.get(value, ()))
+
+        matched.update(
+            i for i in unhashable if any(self.accts[i][attr] == v for v in values)
+        )
+        return matched
+
+    def _attr_index(self, attr):
+        """Returns an inverted index of account positions for the values of `attr`.
+
+        The index is a tuple of a dict mapping each value of `attr` to the set
+        of positions in `self.accts` that have the value, and a list of the
+        positions of accounts whose value cannot be hashed. Indexes are built on
+        first use, so only attributes used in filters are indexed.
+        """
+        if attr not in self._index:
+            index, unhashable = defaultdict(set), []
+            for i, acct in enumerate(self.accts):
+                try:
+                    index[acct[attr]].add(i)
+                except TypeError:
+                    unhashable.append(i)
+            self._index[attr] = (dict(index), unhashable)
+
+        return self._index[attr]
 
     def _parse(self, accts):
         """Returns a tuple of a a list of account dicts and a set of valid attribute names."""
@@ -492,6 +541,7 @@ class MetaAccountLoader(AccountLoader):
         self._normalize_attribute_names(accts)
         attrs = self._filter_attribute_names(accts)
         self._ensure_valid_str_template(attrs)
+        self._intern_values(accts)
 
         return accts, attrs
 
@@ -590,6 +640,21 @@ class MetaAccountLoader(AccountLoader):
         for acct in accts:
             _convert_keys_to_valid_attribute_names(acct)
 
+    def _intern_values(self, accts):
+        """Interns the string values of acct dicts.
+
+        Metadata values such as environment names repeat across many accounts,
+        but parsers create a separate string object for each occurrence.
+        Interning them shares a single object per value, which reduces memory
+        and lets the filter index compare values by identity.
+
+        This function modifies the accts dict in place.
+        """
+        for acct in accts:
+            for key, value in acct.items():
+                if isinstance(value, str):
+                    acct[key] = sys.intern(value)
+
     def _filter_attribute_names(self, accts):
         """Returns the set of selected attributes based on include/exclude filters
         as well as adds missing keys or deletes unused keys.
@@ -677,17 +742,12 @@ class CSVAccountLoader(MetaAccountLoader):
         include_attrs = [] if include_attrs is None else include_attrs
         exclude_attrs = [] if exclude_attrs is None else exclude_attrs
 
-        session = requests.Session()
-        session.mount("file://", FileAdapter())
-
-        def load_cache():
-            r = session.get(url, verify=not no_verify)
-            r.raise_for_status()
+        def parse(r):
             buf = io.StringIO(r.text.strip())
             return list(csv.DictReader(buf, delimiter=delimiter, skipinitialspace=True))
 
         cache_file = Path(tempfile.gettempdir(), "awsrun.dat")
-        accts = PersistentExpiringValue(load_cache, cache_file, max_age=max_age)
+        accts = _URLCache(url, parse, cache_file, max_age, verify=not no_verify)
 
         super().__init__(
             accts.value(),
@@ -748,16 +808,11 @@ class JSONAccountLoader(MetaAccountLoader):
         include_attrs = [] if include_attrs is None else include_attrs
         exclude_attrs = [] if exclude_attrs is None else exclude_attrs
 
-        session = requests.Session()
-        session.mount("file://", FileAdapter())
-
-        def load_cache():
-            r = session.get(url, verify=not no_verify)
-            r.raise_for_status()
+        def parse(r):
             return r.json()
 
         cache_file = Path(tempfile.gettempdir(), "awsrun.dat")
-        accts = PersistentExpiringValue(load_cache, cache_file, max_age=max_age)
+        accts = _URLCache(url, parse, cache_file, max_age, verify=not no_verify)
 
         super().__init__(
             accts.value(),
@@ -822,16 +877,11 @@ class YAMLAccountLoader(MetaAccountLoader):
         include_attrs = [] if include_attrs is None else include_attrs
         exclude_attrs = [] if exclude_attrs is None else exclude_attrs
 
-        session = requests.Session()
-        session.mount("file://", FileAdapter())
-
-        def load_cache():
-            r = session.get(url, verify=not no_verify)
-            r.raise_for_status()
-            return yaml.safe_load(r.text)
+        def parse(r):
+            return yaml.load(r.text, Loader=_YAMLLoader)
 
         cache_file = Path(tempfile.gettempdir(), "awsrun.dat")
-        accts = PersistentExpiringValue(load_cache, cache_file, max_age=max_age)
+        accts = _URLCache(url, parse, cache_file, max_age, verify=not no_verify)
 
         super().__init__(
             accts.value(),
@@ -952,15 +1002,15 @@ class JSONParser:
 class YAMLParser:
     """Returns a list or dict from a buffer of YAML-formatted text.
 
-    To override options passed to `yaml.safe_load`, specify them as keyword
-    arguments in the constructor.
+    To override options passed to `yaml.load`, specify them as keyword
+    arguments in the constructor. The safe loader is always used.
     """
 
     def __init__(self, **kwargs):
         self.kwargs = kwargs
 
     def __call__(self, text):
-        return yaml.safe_load(text, **self.kwargs)
+        return yaml.load(text, Loader=_YAMLLoader, **self.kwargs)
 
 
 class HTTPOAuth2(AuthBase):
@@ -1062,18 +1112,15 @@ class URLAccountLoader(MetaAccountLoader):
         cache_path=None,
     ):
 
-        session = requests.Session()
-        session.mount("file://", FileAdapter())
-
-        def load_cache():
-            r = session.get(url, auth=auth, verify=not no_verify)
-            r.raise_for_status()
+        def parse(r):
             return parser(r.text)
 
         if not cache_path:
             cache_path = Path(tempfile.gettempdir(), "awsrun.dat")
 
-        accts = PersistentExpiringValue(load_cache, cache_path, max_age=max_age)
+        accts = _URLCache(
+            url, parse, cache_path, max_age, auth=auth, verify=not no_verify
+        )
 
         super().__init__(
             accts.value(),
@@ -1085,6 +1132,94 @@ class URLAccountLoader(MetaAccountLoader):
         )
 
 
+class _URLCache(PersistentExpiringValue):
+    """Caches data fetched from a URL and revalidates it when expired.
+
+    The `url` is fetched with `requests` and the response is converted to a
+    JSON-serializable value by the `parse` callable. The value is cached at
+    `path` for `max_age` seconds. Additional keyword arguments are passed to
+    `requests.Session.get`.
+
+    When the cached value has expired, the `ETag` and `Last-Modified` headers
+    from the prior response are sent in a conditional request. If the server
+    responds with 304 Not Modified, the previously cached value is reused and
+    its expiration reset without downloading and parsing the data again. The
+    headers are saved next to the cache with a `.meta` suffix along with the
+    URL and the size and modification time of the cache, so they are only used
+    if the cache still holds the data from the same URL.
+    """
+
+    def __init__(self, url, parse, path, max_age, **kwargs):
+        super().__init__(self._fetch, path, max_age)
+        self._url = url
+        self._parse = parse
+        self._kwargs = kwargs
+        self._meta_path = self._path.with_name(self._path.name + ".meta")
+        self._validators = {}
+
+        self._session = requests.Session()
+        self._session.mount("file://", FileAdapter())
+
+    def _fetch(self):
+        validators = self._load_validators()
+
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        r = self._session.get(self._url, headers=headers, **self._kwargs)
+        if headers and r.status_code == 304:
+            LOG.info("cached data for %s has not been modified", self._url)
+            try:
+                value = self.load()
+            except (OSError, ValueError):
+                # The cache was removed or replaced after the validators were
+                # read, so there is nothing to reuse.
+                LOG.info("cached data for %s is unreadable, refetching", self._url)
+                r = self._session.get(self._url, **self._kwargs)
+            else:
+                self._validators = validators
+                return value
+
+        r.raise_for_status()
+        self._validators = {
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+        }
+        return self._parse(r)
+
+    def save(self, value):
+        super().save(value)
+        if self._max_age == 0:
+            return
+
+        # The cache validators are only an optimization, so failure to save
+        # them is not an error.
+        with suppress(OSError, TypeError, ValueError):
+            stat = self._path.stat()
+            meta = dict(
+                self._validators,
+                url=self._url,
+                key=[stat.st_mtime_ns, stat.st_size],
+            )
+            self._meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+    def _load_validators(self):
+        """Returns the saved validators if they apply to the current cache."""
+        with suppress(OSError, KeyError, TypeError, ValueError):
+            stat = self._path.stat()
+            with self._meta_path.open(encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta["url"] == self._url and meta["key"] == [
+                stat.st_mtime_ns,
+                stat.st_size,
+            ]:
+                return meta
+        return {}
+
+
 class AbstractAccount:
     """Abstract base class used by `MetaAccountLoader` to represent an account and its metadata.
 
@@ -1139,7 +1274,7 @@ class AbstractAccount:
             raise NotImplementedError(
                 f"'{type(self).__name__}' class has no variable 'str_template'"
             )
-        return self._str_template.format(**self._attrs)
+        return self._str_template.format_map(self._attrs)
 
 
 class AccountsNotFoundError(Exception):
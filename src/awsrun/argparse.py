@@ -45,15 +45,17 @@ class AppendWithoutDefault(argparse.Action):
         Namespace(region=['central'])
     """
 
-    def __init__(self, *args, **kwargs):
-        self.has_been_called = False
-        super().__init__(*args, **kwargs)
-
     def __call__(self, parser, namespace, values, option_string=None):
-        current = [] if not self.has_been_called else getattr(namespace, self.dest)
+        # The namespace holds the default itself until the first time the
+        # option is seen, at which point it is replaced with a new list that
+        # is appended to in place for the remaining occurrences. Checking by
+        # identity rather than remembering state on the action allows the same
+        # parser to be used more than once and never mutates the default.
+        current = getattr(namespace, self.dest, None)
+        if current is None or current is self.default:
+            current = []
+            setattr(namespace, self.dest, current)
         current.append(values)
-        setattr(namespace, self.dest, current)
-        self.has_been_called = True
 
 
 class AppendAttributeValuePair(argparse.Action):
@@ -121,9 +123,13 @@ class AppendAttributeValuePair(argparse.Action):
         # default parameter to getattr as the attribute will always exist.
         d = getattr(namespace, self.dest)
 
-        # If it is None, then create a dict to store the parsed results.
+        # If it is None, then create a dict to store the parsed results. If it
+        # is still the default, copy it once, so the values can be appended in
+        # place without mutating the default provided by the user.
         if d is None:
             d = {}
+        elif d is self.default:
+            d = {k: list(v) for k, v in d.items()}
 
         # Normally I would use a defaultdict(list) when checking for a key
         # and setting a default value, but this cannot be used here as the
@@ -30,12 +30,32 @@ The third value, however, is ten seconds later because by the time the third
 invocation of `value` took place, the original value expired after 10 seconds.
 """
 
+import contextlib
 import json
 import logging
+import os
+import tempfile
 import threading
 import time
 from pathlib import Path
 
+# Use orjson to parse cached values if it is installed as it is considerably
+# faster than the standard library, which matters for large account lists.
+# Values are written with the json module, which also permits NaN, Infinity,
+# and integers beyond 64 bits that orjson rejects, so fall back to the json
+# module for those rare cache files.
+try:
+    import orjson
+
+    def _json_loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+except ImportError:
+    _json_loads = json.loads
+
 LOG = logging.getLogger(__name__)
 
 
@@ -50,7 +70,9 @@ class AbstractExpiringValue:
     retrieved the first time the value method is invoked. Likewise, the value is
     not refreshed at the time it expires, but only the next time the value
     method is called. This class is thread-safe. Subclasses must provide
-    implementations for `is_expired`, `load`, and `save`.
+    implementations for `is_expired`, `load`, and `save`. Only `save` is
+    serialized by a lock, so `is_expired` and `load` must be safe to call
+    while another thread is saving a refreshed value.
     """
 
     def __init__(self, refresh_fn, max_age):
@@ -67,7 +89,13 @@ class AbstractExpiringValue:
         expires. If you set `refresh` parameter to `True`, the value will be
         refreshed and the expiration will be reset before being returned.
         """
+        # Fast path: a cache hit does not need the lock. The lock is only
+        # needed to ensure a single thread refreshes an expired value.
+        if not refresh and not self.is_expired():
+            return self.load()
+
         with self._lock:
+            # Another thread may have refreshed the value while we waited.
             if not refresh and not self.is_expired():
                 return self.load()
 
@@ -128,11 +156,17 @@ class ExpiringValue(AbstractExpiringValue):
         return time.time() >= self._expiry
 
     def load(self):
-        LOG.debug("Loading data from cache")
+        # This is called on every cache hit, so avoid the overhead of a call
+        # into the logging machinery unless debug logging is actually enabled.
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Loading data from cache")
         return self._value
 
     def save(self, value):
-        LOG.debug("Saving value to cache")
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Saving value to cache")
+        # Set the value before the expiry, so a lock-free reader that sees the
+        # new expiry is guaranteed to see the new value as well.
         self._value = value
         self._expiry = time.time() + self._max_age
 
@@ -164,19 +198,35 @@ class PersistentExpiringValue(ExpiringValue):
         return time.time() > last_modification + self._max_age
 
     def load(self):
-        LOG.debug("Loading cached data from %s", self._path)
-        with self._path.open("r", encoding="utf-8") as file:
-            return json.load(file)
+        # Called on every cache hit, so only log when debugging is enabled.
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Loading cached data from %s", self._path)
+        return _json_loads(self._path.read_bytes())
 
     def save(self, value):
         # No need to persist the file if max_age is 0 seconds.
         if self._max_age == 0:
             return
 
-        LOG.debug("Saving data to cache file %s", self._path)
-        tmp = self._path.with_suffix(".tmp")
-        with tmp.open("w", encoding="utf-8") as file:
-            json.dump(value, file)
-
-        # Pathlib.replace uses os.replace which is atomic on POSIX systems
-        tmp.replace(self._path)
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("Saving data to cache file %s", self._path)
+
+        # Use a unique temporary file for each save, so concurrent writers
+        # (e.g. two processes sharing the same cache path) never clobber each
+        # other's partially written data before the atomic replace.
+        fd, tmp = tempfile.mkstemp(
+            dir=str(self._path.parent), prefix=self._path.name + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(value, file)
+                # Make sure the data is on disk before the rename, so a crash
+                # cannot leave an empty or truncated file at the cache path.
+                file.flush()
+                os.fsync(file.fileno())
+            # os.replace is atomic on POSIX systems
+            os.replace(tmp, str(self._path))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
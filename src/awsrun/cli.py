@@ -568,7 +568,8 @@ commands defined within. The default path is "awsrun.commands.aws".
 `--metadata`
 :  List the available metadata attributes from the account loader. If an
 attribute name is passed as an argument to the flag, list the available values
-for that metadata attribute.
+for that metadata attribute. Only the account loader plug-in is loaded when this
+flag is used, so any other plug-in or command arguments are ignored.
 
 `include`, `--include`
 :  Include only the accounts that match the specified filter. A filter consists
@@ -616,6 +617,14 @@ environment variable to use an alternate configuration file. Options defined in
 the configuration file can generally be overridden via command line arguments as
 noted in the prior section.
 
+Because the configuration is read every time the CLI is invoked, the parsed YAML
+is saved as JSON alongside the configuration file with a `.cache.json` suffix
+(e.g. `$HOME/.awsrun.yaml.cache.json`). JSON is much faster to parse than YAML.
+The cache is keyed by a SHA-256 digest of the YAML file's contents, so edits to
+the configuration take effect immediately, even if they happen within the
+timestamp resolution of the filesystem. It is safe to delete the cache file at
+any time.
+
 The configuration file contains four, optional, top-level sections: `CLI`,
 `Commands`, `Accounts`, and `Credentials`. Each section is described below in
 more detail.
@@ -718,26 +727,36 @@ need to set the environment variable for command exceptions.
 """
 
 import argparse
+import contextlib
+import hashlib
+import io
+import json
 import logging
 import os
 import sys
+import tempfile
 import traceback
 from datetime import timedelta
 from functools import partial
 from pathlib import Path
 
 from awsrun import __version__
-from awsrun.acctload import AccountLoader
 from awsrun.argparse import (
     AppendAttributeValuePair,
     AppendWithoutDefault,
     RawAndDefaultsFormatter,
 )
-from awsrun.cmdmgr import CommandManager
-from awsrun.config import Any, Choice, Config, Dict, File, Int, List, Str
-from awsrun.plugmgr import PluginManager
-from awsrun.runner import AccountRunner
-from awsrun.session import SessionProvider
+from awsrun.config import (
+    Any,
+    Choice,
+    Config,
+    Dict,
+    File,
+    Int,
+    List,
+    Str,
+    YAMLConfig,
+)
 
 LOG = logging.getLogger(__name__)
 
@@ -794,10 +813,17 @@ def _cli(csp):
     the main interactive command line tool and may print output to the console.
     """
 
+    # A lone --version flag needs neither the user configuration nor any of the
+    # plug-ins, so answer it before doing that work. The output matches what the
+    # argparse version action defined below would print.
+    if sys.argv[1:] == ["--version"]:
+        print(f"{os.path.basename(sys.argv[0])} {__version__}")
+        sys.exit(0)
+
     # Load the main user configuration file, which is used extensively to
     # provide default values for argparse arguments. This allows users to
     # specify default values for commonly used flags.
-    config = Config.from_file(csp.config_filename())
+    config = _load_config(csp.config_filename())
 
     # Build a callable to simplify access to the 'CLI' section of the config.
     cfg = partial(config.get, "CLI", type=Str)
@@ -961,10 +987,29 @@ def _cli(csp):
 
     # STAGE 2 Argument Processing (see description above).
 
+    # The account loader module pulls in third-party HTTP libraries, so it is
+    # not imported until we know a loader is needed, which keeps trivial
+    # invocations such as --version fast. The plugin manager is deferred for
+    # the same reason as it imports the inspect module.
+    from awsrun.acctload import AccountLoader
+    from awsrun.plugmgr import PluginManager
+
     # The plugin manager will load the two plugins and handle command line
     # parsing of any arguments registered by the plugins.
     plugin_mgr = PluginManager(config, parser, args, remaining_argv)
     plugin_mgr.parse_args("Accounts", default="awsrun.plugins.accts.Identity")
+
+    # Check to see if user is inquiring about the metadata associated with
+    # accounts. Only the account loader plug-in is needed to answer, so we do
+    # this before loading the credential plug-in, which can be expensive to
+    # import (e.g. boto3). Any remaining arguments are ignored unless the user
+    # has requested help, in which case we fall through, so the help includes
+    # the flags registered by all plug-ins.
+    if args.metadata and not {"-h", "--help"}.intersection(plugin_mgr.remaining_argv):
+        account_loader = plugin_mgr.instantiate("Accounts", must_be=AccountLoader)
+        _print_metadata(account_loader, args.metadata)
+        sys.exit(0)
+
     plugin_mgr.parse_args("Credentials", default=csp.default_session_provider())
 
     # STAGE 3 Argument Processing (see description above).
@@ -984,40 +1029,31 @@ def _cli(csp):
     # If there are extra args or unknown args, parse_args will exit here with an
     # error message and usage string. Note that we obtain the remaining unused
     # argv from the plugin manager as well as the namespace to add these last
-    # arguments.
-    args = parser.parse_args(plugin_mgr.remaining_argv, plugin_mgr.args)
+    # arguments. Everything after the command name belongs to the command, so
+    # it is sliced off rather than handing a potentially long list of command
+    # arguments to argparse only to have them collected by REMAINDER. The
+    # REMAINDER argument remains defined, so it is included in the help.
+    argv = plugin_mgr.remaining_argv
+    cmd_index = next((i for i, a in enumerate(argv) if not a.startswith("-")), None)
+    if cmd_index is None:
+        args = parser.parse_args(argv, plugin_mgr.args)
+    else:
+        args = parser.parse_args(argv[: cmd_index + 1], plugin_mgr.args)
+        args.arguments = argv[cmd_index + 1 :]
 
     # Use the plugin manager to create the actual account loader that will be
     # used to load accounts and metadata for accounts.
     account_loader = plugin_mgr.instantiate("Accounts", must_be=AccountLoader)
 
-    # Check to see if user is inquiring about the metadata associated with
-    # accounts. If they pass --metadata by itself, print out a list of all
-    # possible attribute names. If they pass an arg to --metadata, such as
-    # "--metadata BU", then print out all the possible values of that attr,
-    # so they can build filters for it.
-    if args.metadata:
-        attrs = account_loader.attributes()
-        if args.metadata in attrs:
-            print(f"Metadata values for '{args.metadata}' attribute:\n")
-            print(
-                "\n".join(sorted(str(x) for x in attrs[args.metadata] if x is not None))
-            )
-        elif attrs:
-            print("Valid metadata attributes:\n")
-            print("\n".join(sorted(attrs)))
-        else:
-            print("No metadata attributes available")
-        sys.exit(0)
-
     # Check to see if the user wants to load additional accounts from a file
     # specified on the command line. If so, the account IDs will be appended to
     # any accounts defined on the command line or in the user config.
     if args.account_file:
-        args.accounts.extend(
-            a.strip()
-            for a in args.account_file
-            if not (a.isspace() or a.startswith("#"))
+        # A new list is built rather than extending in place as args.accounts
+        # may be the list from the user config. Duplicate IDs, which are common
+        # when files are concatenated, are dropped while preserving order.
+        args.accounts = list(
+            dict.fromkeys([*args.accounts, *_read_account_file(args.account_file)])
         )
 
     # Obtain a list of account *objects* for the specified account IDs. The
@@ -1036,6 +1072,10 @@ def _cli(csp):
         print("No accounts selected", file=sys.stderr)
         sys.exit(1)
 
+    # The command manager imports the runner and the session modules, which are
+    # not needed for --version, --help, or --metadata, so defer it until here.
+    from awsrun.cmdmgr import CommandManager
+
     # The command manager will be used to search, parse command arguments, and
     # instantiate the command that was specified on the CLI. It can also provide
     # a list of all commands found in the paths provided.
@@ -1046,7 +1086,7 @@ def _cli(csp):
     # allows users to test filters to see which accounts will be acted upon.
     if not args.command:
         _print_accounts(accounts)
-        _print_valid_commands(command_mgr.commands())
+        _print_valid_commands(command_mgr.command_docs())
         sys.exit(1)
 
     # STAGE 4 Argument Processing (see description above). When the command
@@ -1063,7 +1103,7 @@ def _cli(csp):
     # list of valid commands that the command manager knows about. The exception
     # re-raised so it will be handled by the same error handling logic in main().
     except Exception:
-        _print_valid_commands(command_mgr.commands(), out=sys.stderr)
+        _print_valid_commands(command_mgr.command_docs(), out=sys.stderr)
         raise
 
     # Safety check to make sure user knows they are impacting more than one
@@ -1071,6 +1111,11 @@ def _cli(csp):
     if len(accounts) > 1 and not args.force:
         _ask_for_confirmation(accounts)
 
+    # Nothing below is needed until the user has confirmed the accounts, so
+    # defer these imports until then.
+    from awsrun.runner import AccountRunner
+    from awsrun.session import SessionProvider
+
     # Load up a session provider to hand out creds for the runner.
     session_provider = plugin_mgr.instantiate("Credentials", must_be=SessionProvider)
 
@@ -1093,38 +1138,177 @@ def _cli(csp):
     )
 
 
+def _load_config(filename):
+    """Returns the `Config` loaded from `filename` using a JSON sidecar cache.
+
+    YAML parsing is slow compared to JSON parsing, and the user configuration is
+    loaded on every invocation of the CLI, so the parsed YAML is saved as JSON
+    next to the configuration file. The cache is used as long as the digest of
+    the YAML file's contents matches the one it was written with. Hashing the
+    small file is cheap compared to parsing it, and unlike its modification time,
+    it cannot miss an edit made within the filesystem's timestamp resolution.
+    The cache can inject settings such as `cmd_path` or plugins, so it is only
+    trusted if it is owned by the current user and writable by no one else.
+    Other configuration files, including YAML files for which a user has
+    registered their own parser via `Config.register_filetype`, are loaded
+    directly via `Config.from_file` without a cache.
+    """
+    path = Path(filename)
+    filetypes = Config._filetypes  # pylint: disable=protected-access
+    config_class = filetypes.get(path.suffix)
+    if config_class is not YAMLConfig or not path.is_file():
+        return Config.from_file(path)
+
+    data = path.read_bytes()
+    key = hashlib.sha256(data).hexdigest()
+    cache_path = path.with_name(path.name + ".cache.json")
+
+    # A missing, unreadable, corrupt, or stale cache is not an error, we just
+    # fall back to parsing the YAML and then try to refresh the cache.
+    with contextlib.suppress(OSError, ValueError, AttributeError, KeyError):
+        with cache_path.open(encoding="utf-8") as f:
+            # Check the opened file, so it cannot be swapped after the check.
+            if not _is_private(os.fstat(f.fileno())):
+                raise ValueError(f"{cache_path} is not private to the user")
+            cached = json.load(f)
+        if cached.get("key") == key:
+            LOG.debug("loaded config from cache %s", cache_path)
+            return Config(cached["config"])
+
+    # Parse the same bytes that were hashed, so the cache can never associate the
+    # digest with the contents of a file modified in between.
+    config = config_class(io.StringIO(data.decode("utf-8")))
+    _save_config_cache(cache_path, key, config.conf)
+    return config
+
+
+def _save_config_cache(cache_path, key, conf):
+    """Atomically saves the parsed `conf` dict as JSON to `cache_path`.
+
+    Nothing is saved if `conf` cannot be represented faithfully in JSON. For
+    example, YAML permits dates as values and ints as keys, neither of which
+    would survive a round-trip through JSON. Nor is it saved if the directory
+    is not owned by the current user, as the cache would not be trusted by
+    `_load_config`. Failures to write the cache are ignored as the cache is
+    only an optimization.
+    """
+    try:
+        data = json.dumps({"key": key, "config": conf})
+        if json.loads(data)["config"] != conf:
+            return
+        if not _is_owned(os.stat(str(cache_path.parent))):
+            return
+    except (OSError, TypeError, ValueError):
+        return
+
+    try:
+        fd, tmp = tempfile.mkstemp(
+            dir=str(cache_path.parent), prefix=cache_path.name + ".", suffix=".tmp"
+        )
+    except OSError as e:
+        LOG.debug("could not write config cache %s: %s", cache_path, e)
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, str(cache_path))
+    except OSError as e:
+        LOG.debug("could not write config cache %s: %s", cache_path, e)
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+
+
+def _is_owned(st):
+    """Returns True if the `os.stat_result` `st` is owned by the current user.
+
+    Ownership cannot be checked on platforms without `os.getuid`, such as
+    Windows, so False is returned.
+    """
+    return hasattr(os, "getuid") and st.st_uid == os.getuid()
+
+
+def _is_private(st):
+    """Returns True if `st` is owned by the current user and only they can write it."""
+    return _is_owned(st) and not st.st_mode & 0o022
+
+
+def _read_account_file(f):
+    """Return the account IDs listed in file object `f`, one per line.
+
+    Blank lines and lines starting with "#" are ignored. The file is read in a
+    single call and split rather than iterated line by line, and each line is
+    stripped exactly once via `map`, which is noticeably faster for files
+    listing thousands of accounts.
+    """
+    lines = f.read().splitlines()
+    return [s for line, s in zip(lines, map(str.strip, lines)) if s and line[0] != "#"]
+
+
+def _print_metadata(account_loader, attr, out=sys.stdout):
+    """Print a summary of the metadata available from the account loader.
+
+    If `attr` is `True`, i.e. --metadata was passed by itself, print out a list
+    of all possible attribute names. If `attr` is the name of an attribute, such
+    as "--metadata BU", then print out all the possible values of that attr, so
+    users can build filters for it.
+    """
+    attrs = account_loader.attributes()
+    if attr in attrs:
+        print(f"Metadata values for '{attr}' attribute:\n", file=out)
+        values = [str(x) for x in attrs[attr] if x is not None]
+        values.sort()
+        print("\n".join(values), file=out)
+    elif attrs:
+        print("Valid metadata attributes:\n", file=out)
+        print("\n".join(sorted(attrs)), file=out)
+    else:
+        print("No metadata attributes available", file=out)
+
+
 def _print_valid_commands(commands, out=sys.stdout):
     """Pretty print a table of commands.
 
-    The argument is a dict where keys are the names and values are CLICommand
-    classes from the command modules.
+    The argument is a dict where keys are the names and values are the
+    docstrings of the CLICommand classes from the command modules.
     """
     if not commands:
         print("No commands found, did you specify the correct --cmd-path?", file=out)
         return
 
-    print("The following are the available commands:\n", file=out)
-    max_cmd_len = max(len(name) for name in commands.keys())
-    for name in sorted(commands.keys()):
-        # By convention, as documented in user documentation, class docstring
-        # is used when printing a summary of commands.
-        docstring = commands[name].__doc__ or ""
-        print(f"{name:{max_cmd_len}}  {docstring}", file=out)
-    print(file=out)
+    # By convention, as documented in user documentation, class docstring is
+    # used when printing a summary of commands. The table is built in memory
+    # and printed with a single call.
+    max_cmd_len = max(map(len, commands))
+    lines = [
+        name.ljust(max_cmd_len) + "  " + (commands[name] or "")
+        for name in sorted(commands)
+    ]
+    lines.insert(0, "The following are the available commands:\n")
+    print("\n".join(lines), file=out, end="\n\n")
 
 
 def _print_accounts(accts, out=sys.stdout):
     """Print the list of accounts."""
     count = len(accts)
     print(f'{count} account{"s" if count != 1 else ""} selected:\n', file=out)
-    print(", ".join(str(a) for a in accts), file=out, end="\n\n")
+    print(", ".join(map(str, accts)), file=out, end="\n\n")
 
 
 def _ask_for_confirmation(accts):
     """Prompt user for confirmation and list accounts to be acted upon."""
     _print_accounts(accts, out=sys.stderr)
     print("Proceed (y/n)? ", flush=True, end="", file=sys.stderr)
-    answer = input()
+
+    # When stdin is not interactive, e.g. a cron job that forgot --force, there
+    # may be no answer at all. Rather than surfacing a bare EOFError, explain
+    # how to skip the prompt. Piping an answer, e.g. `yes | awsrun ...`, works.
+    try:
+        answer = input()
+    except EOFError:
+        print("\nNo answer received, use --force to skip this prompt", file=sys.stderr)
+        sys.exit(1)
+
     if not answer.lower() in ["y", "yes"]:
         print("Exiting", file=sys.stderr)
         sys.exit(0)
@@ -1155,15 +1339,19 @@ class _CSP:
        on how to build plug-ins.
     """
 
+    # Names of the installed CLI tools and the CSP each one represents.
+    _PROG_NAMES = {"awsrun": "aws", "azurerun": "azure"}
+
     @classmethod
     def from_prog_name(cls, prog_name):
         """Return CSP instance based on prog_name."""
 
         # Identify the CSP name from the name of the installed CLI tool. The
         # installed CLI will be called "awsrun" or "azurerun".
-        csp = Path(prog_name).name.replace("run", "")
-        if csp not in ["aws", "azure"]:
-            raise Exception(f"unknown variant: {csp}")
+        name = os.path.basename(prog_name)
+        csp = cls._PROG_NAMES.get(name)
+        if csp is None:
+            raise Exception(f"unknown variant: {name}")
         return cls(csp)
 
     def __init__(self, name):
@@ -1172,8 +1360,13 @@ class _CSP:
     def config_filename(self):
         """Returns the path to the user configuration."""
         env_var = self.name.upper() + "RUN_CONFIG"
+        if env_var in os.environ:
+            return os.environ[env_var]
+
+        # Only resolve the home directory when it is needed as it may require a
+        # lookup in the password database if HOME is not set.
         dotfile = "." + self.name.lower() + "run.yaml"
-        return os.environ.get(env_var, Path.home() / dotfile)
+        return Path.home() / dotfile
 
     def default_command_path(self):
         """Returns the path to the builtin commands submodule."""
@@ -1,9 +1,10 @@
 """Provides a means of retrieving metrics from AWS CloudWatch.
 
 This module provides the `CWMetrics` class that can be used to retrieve up to
-500 metrics in a single AWS CloudWatch API call. Queue one or more metrics for
-retrieval via `CWMetrics.add_metric`, and then invoke `CWMetrics.bulk_load` to
-make the request to AWS. The results for each metric can be retrieved by
+500 metrics in a single AWS CloudWatch API call. More than 500 metrics are split
+across concurrent API calls. Queue one or more metrics for retrieval via
+`CWMetrics.add_metric`, and then invoke `CWMetrics.bulk_load` to make the
+request to AWS. The results for each metric can be retrieved by
 invoking the callable returned by `CWMetrics.add_metric`. For example:
 
     client = session.client("cloudwatch", region_name="us-east-1")
@@ -32,7 +33,7 @@ invoking the callable returned by `CWMetrics.add_metric`. For example:
 
 import logging
 import math
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 _LOG = logging.getLogger(__name__)
@@ -40,6 +41,9 @@ _LOG = logging.getLogger(__name__)
 # AWS limits the number of metric requets per call to get_metric_data.
 _MAX_METRICS = 500
 
+# Maximum number of get_metric_data calls made concurrently by a bulk load.
+_MAX_WORKERS = 8
+
 
 class _MetricResult:
     """Lightweight container to hold metric results."""
@@ -55,8 +59,9 @@ class CWMetrics:
     """Retrieve one or more AWS CloudWatch metrics efficiently.
 
     This class uses the AWS CloudWatch get_metrics_data() API to retrieve up
-    to 500 different metrics in a single API call. `client` must be a valid
-    boto3 CloudWatch client. `last` is the number of seconds of data to
+    to 500 different metrics in a single API call. If more than 500 metrics
+    are added, they are split across concurrent API calls. `client` must be a
+    valid boto3 CloudWatch client. `last` is the number of seconds of data to
     retrieve. `samples` is the number of data points requested. By default,
     the `ingestion_interval` is 60 seconds. Note: this class does not support
     metrics with ingestion intervals less than 60 seconds.
@@ -68,7 +73,10 @@ class CWMetrics:
         self._samples = samples
         self._ingestion_interval = ingestion_interval
         self._period = self._compute_period()
-        self._beg = self._end = datetime.now()
+
+        # The time range of the last bulk_load, which is computed from the
+        # current time each time bulk_load is called
+        self._beg = self._end = None
 
         _LOG.info(
             "CWMetrics(client, last=%d, samples=%d, ingestion_interval=%d)",
@@ -84,16 +92,24 @@ class CWMetrics:
         # Provides a unique id for each metric (required by the CW API)
         self._counter = 0
 
+        # Maps each distinct metric added to its unique id, so the same
+        # metric added more than once is only retrieved once.
+        self._metric_ids = {}
+
         # Stores the results of the last bulk_load, keyed by the unique ID
-        self._results = defaultdict(_MetricResult)
+        self._results = {}
+
+        # The datetimes of each sample interval of the last bulk_load
+        self._ticks = []
 
     def add_metric(self, namespace, name, dimensions, statistic):
         """Queue the specified CloudWatch metric for bulk loading.
 
         Use this method to register a metric for future retrieval via
-        `CWMetric.bulk_load`. Up to 500 metrics can be added. Once a metric
+        `CWMetric.bulk_load`. Any number of metrics can be added. Once a metric
         has been added, subsequent calls to `CWMetric.bulk_load` will retrieve
-        it again.
+        it again. Adding the same metric more than once, regardless of the
+        order of `dimensions`, does not retrieve it more than once.
 
         Returns a function that can be invoked after a bulk load has
         completed. It will return a generator object that yields a tuple
@@ -103,24 +119,28 @@ class CWMetrics:
         missing data points. In that case, the value in the tuple will be a
         `math.nan`.
         """
-        # We need to keep track of how many metrics are being retrieved as AWS
-        # only permits up to 500 in a single get_metric_data call. We also
-        # need a unique ID for each metric added as that is how we will match
-        # the response from the CW API.
-        self._counter += 1
-        if self._counter > _MAX_METRICS:
-            raise ValueError(f"number of metrics exceeded {_MAX_METRICS}")
+        # Identical metrics share a single query, so the results of the one
+        # query are returned to each caller that added it.
+        dimensions = tuple(sorted(dimensions.items()))
+        key = (namespace, name, dimensions, statistic)
+        if key in self._metric_ids:
+            metric_id = self._metric_ids[key]
+            return lambda: self._get_metric_generator(metric_id)
 
         # The AWS get_metric_data call requires a unique ID for each metric
         # being retrieved. This ID is provided with the results, so the caller
         # is able to match request with response. The ID only needs to be
-        # unique per call to get_metric_data, so we just use a simple counter
-        # as we'll never expose this ID to callers.
-        metric_id = f"id{self._counter}"
+        # unique per call to get_metric_data, but we keep it unique across
+        # all queries as they may be split over several calls and their
+        # results merged. We use a simple counter as we'll never expose this
+        # ID to callers.
+        self._counter += 1
+        metric_id = self._metric_ids[key] = f"id{self._counter}"
+        self._results[metric_id] = _MetricResult()
 
         # Convert a dict in form of {"connId": "dxcon-aaa"} to the form
         # required by AWS: [{"Name": "connId", "Value": "dxcon-aaa"}].
-        dimensions = [{"Name": n, "Value": v} for n, v in dimensions.items()]
+        dimensions = [{"Name": n, "Value": v} for n, v in dimensions]
 
         # Create the query dict and append to the list of queries. The query
         # is not executed until later when the user calls bulk_load().
@@ -148,8 +168,10 @@ class CWMetrics:
     def bulk_load(self):
         """Retrieve the metrics that have been queued.
 
-        This method will make a single API call to AWS to request all of the
-        requested metrics. This method may be called one or more times. Each
+        This method will make a single API call to AWS to request up to 500 of
+        the requested metrics. If more have been queued, they are split into
+        chunks of 500 and requested concurrently. This method may be called
+        one or more times. Each
         call will retrieve the metrics that were requested replacing the
         results of a prior invocation.
 
@@ -160,16 +182,40 @@ class CWMetrics:
         if not self._queries:
             return
 
-        self._results = defaultdict(_MetricResult)
+        # Reuse the result containers allocated by add_metric rather than
+        # allocating new ones for every load.
+        for result in self._results.values():
+            result.timestamps.clear()
+            result.values.clear()
+
         self._beg, self._end = self._compute_datetime_range()
 
-        for page in self._client.get_paginator("get_metric_data").paginate(
-            MetricDataQueries=self._queries,
-            StartTime=self._beg.isoformat(),
-            EndTime=self._end.isoformat(),
-            ScanBy="TimestampAscending",
-        ):
-            for mdr in page["MetricDataResults"]:
+        # The time intervals of the results are the same for every metric, so
+        # compute them once rather than each time results are iterated.
+        step = timedelta(seconds=self._period)
+        self._ticks = []
+        clock = self._beg
+        while clock < self._end:
+            self._ticks.append(clock)
+            clock += step
+
+        # AWS only permits 500 metrics per get_metric_data call, so larger
+        # requests are split into chunks. Each chunk is retrieved in its own
+        # thread as the calls spend most of their time waiting on AWS.
+        chunks = [
+            self._queries[i : i + _MAX_METRICS]
+            for i in range(0, len(self._queries), _MAX_METRICS)
+        ]
+        if len(chunks) == 1:
+            pages = [self._load_chunk(chunks[0])]
+        else:
+            with ThreadPoolExecutor(min(_MAX_WORKERS, len(chunks))) as executor:
+                pages = list(executor.map(self._load_chunk, chunks))
+
+        # Merge the results in the main thread, so the results dict is never
+        # modified concurrently.
+        for mdrs in pages:
+            for mdr in mdrs:
                 count = len(mdr["Values"])
                 _LOG.info(
                     "Results for %s (%s): count=%d status=%s",
@@ -178,7 +224,9 @@ class CWMetrics:
                     count,
                     mdr["StatusCode"],
                 )
-                if count > 1:
+                # Guard the sample logging, so the indexing needed to build
+                # its arguments is skipped when INFO logging is disabled.
+                if count > 1 and _LOG.isEnabledFor(logging.INFO):
                     _LOG.info(" [0]: %s %.2f", mdr["Timestamps"][0], mdr["Values"][0])
                     _LOG.info(" [1]: %s %.2f", mdr["Timestamps"][1], mdr["Values"][1])
                     _LOG.info("[-2]: %s %.2f", mdr["Timestamps"][-2], mdr["Values"][-2])
@@ -190,6 +238,30 @@ class CWMetrics:
                 result.values.extend(mdr["Values"])
                 result.timestamps.extend(mdr["Timestamps"])
 
+    def _load_chunk(self, queries):
+        """Return the metric data results for up to 500 `queries`.
+
+        Responses are requested until AWS no longer returns a `NextToken`,
+        so the list returned includes the results from every page.
+        """
+        kwargs = {
+            "MetricDataQueries": queries,
+            "StartTime": self._beg.isoformat(),
+            "EndTime": self._end.isoformat(),
+            "ScanBy": "TimestampAscending",
+        }
+
+        # A single response almost always contains every data point, so we
+        # call the API directly rather than through a paginator, and only
+        # ask for additional pages when AWS indicates there are more.
+        mdrs = []
+        while True:
+            resp = self._client.get_metric_data(**kwargs)
+            mdrs.extend(resp["MetricDataResults"])
+            if "NextToken" not in resp:
+                return mdrs
+            kwargs["NextToken"] = resp["NextToken"]
+
     def _get_metric_generator(self, metric_id):
         """Returns a generator to iterate over metric results.
 
@@ -202,18 +274,11 @@ class CWMetrics:
         if not result.timestamps:
             return
 
-        index = 0
-        count = len(result.timestamps)
-        clock = self._beg
-
-        while clock < self._end:
-            if index >= count or result.timestamps[index] != clock:
-                yield clock, math.nan
-            else:
-                yield clock, result.values[index]
-                index += 1
-
-            clock += timedelta(seconds=self._period)
+        # Index the values by timestamp, so each expected time interval is a
+        # single lookup. Intervals without a data point yield a NaN.
+        values = dict(zip(result.timestamps, result.values))
+        for clock in self._ticks:
+            yield clock, values.get(clock, math.nan)
 
     def _compute_datetime_range(self):
         """Return aligned start and end datetime objects.
@@ -63,10 +63,13 @@ all the discovered commands found in the configured paths.
 import argparse
 import ast
 import contextlib
+import copy
 import importlib
+import importlib.util
 import logging
 import os
 import pkgutil
+import re
 import sys
 
 from awsrun.argparse import RawAndDefaultsFormatter
@@ -74,6 +77,9 @@ from awsrun.runner import Command
 
 LOG = logging.getLogger(__name__)
 
+# A top-level CLICommand class definition must start at the beginning of a line.
+_CLICOMMAND_RE = re.compile(rb"^class\s+CLICommand\b", re.MULTILINE)
+
 
 class CommandManager:
     """Manages the loading and instantiation of user-defined awsrun commands.
@@ -114,6 +120,15 @@ class CommandManager:
         """Returns a dict of names and classes of all valid commands."""
         return self._loader.load_all()
 
+    def command_docs(self):
+        """Returns a dict of names and `CLICommand` docstrings of all commands.
+
+        Unlike `commands`, the command modules are not imported, so this is
+        much faster when only a summary of the commands is needed. As a
+        result, some of the commands listed may fail to load.
+        """
+        return self._loader.load_docs()
+
     def instantiate_command(self, command_name, argv, cfg):
         """Returns an instantiated command identified by `command_name`.
 
@@ -160,7 +175,9 @@ class CommandManager:
 class CommandLoader:
     """Abstract base class that loads user-defined awsrun commands from a source.
 
-    Subclasses must provide implementations for `load` and `load_all`.
+    Subclasses must provide implementations for `load` and `load_all`. The
+    defaults for `load_docs` and `load_names` are built from `load_all`, so
+    subclasses that can avoid importing every command should override them.
     """
 
     def load(self, command_name):
@@ -178,6 +195,28 @@ class CommandLoader:
         """
         raise NotImplementedError
 
+    def load_docs(self):
+        """Returns a dict of the docstrings of all commands found.
+
+        The keys of the dict are the command names and the values are the
+        docstrings of their `CLICommand` classes, or None if they have none.
+        Where possible, the docstrings are read without importing commands.
+        The listing is then a best-effort prefilter: commands without a
+        `CLICommand` class or missing a top-level package they require are
+        left out, but a listed command may still fail to load. Once `load` has
+        been attempted, its outcome is used instead, so commands that failed
+        to load are not included.
+        """
+        return {name: cls.__doc__ for name, cls in self.load_all().items()}
+
+    def load_names(self):
+        """Returns the names of the candidate commands.
+
+        Candidates are not loaded, so some of the names returned may not be
+        valid commands.
+        """
+        return list(self.load_all())
+
 
 class ChainLoader(CommandLoader):
     """Chains multiple command loaders together in a priority order.
@@ -214,15 +253,36 @@ class ChainLoader(CommandLoader):
         objects that have been loaded.  If a command is found in multiple
         loaders, the first loader containing the command is preferred.
         """
+        # Each name is loaded once from the first loader that has a valid
+        # command by that name, so commands shadowed by a loader earlier in
+        # the list are never parsed or imported.
         classes = {}
-        for loader in reversed(self.loaders):
-            # dict.update() replaces existing keys with new values, so reversing
-            # the list ensures that loaders at the beginning of the list take
-            # priority over those that come afterwards.
-            classes.update(loader.load_all())
+        for name in self.load_names():
+            with contextlib.suppress(CommandNotFoundError):
+                classes[name] = self.load(name)
 
         return classes
 
+    def load_docs(self):
+        """Returns a dict of the docstrings of all commands from all loaders.
+
+        If a command is found in multiple loaders, the first loader containing
+        the command is preferred.
+        """
+        # Loaders only return docstrings for the commands they can load, so
+        # taking the first one for each name matches the command that load()
+        # resolves by trying each loader in order.
+        docs = {}
+        for loader in self.loaders:
+            for name, doc in loader.load_docs().items():
+                docs.setdefault(name, doc)
+
+        return docs
+
+    def load_names(self):
+        """Returns a set of the names of the candidate commands in all loaders."""
+        return set().union(*(loader.load_names() for loader in self.loaders))
+
 
 class DirectoryLoader(CommandLoader):
     """Loads user-defined awsrun commands from a filesystem directory.
@@ -230,6 +290,10 @@ class DirectoryLoader(CommandLoader):
     The `directory_path` parameter specifies a directory that should contain one
     or more Python modules that implement a class called `CLICommand`, which
     allows the loader to find compatible commands.
+
+    The outcome of inspecting and loading each file is cached by its
+    modification time and size, so subsequent loads of an unchanged file do
+    not parse it again.
     """
 
     def __init__(self, directory_path):
@@ -237,49 +301,116 @@ class DirectoryLoader(CommandLoader):
         if directory_path not in sys.path:
             sys.path.append(directory_path)
 
+        # Maps a file path to a `_CacheEntry` for its current contents.
+        self._cache = {}
+
     def load(self, command_name):
         fullpath = os.path.join(self.path, command_name) + ".py"
         LOG.info("loading command at '%s'", fullpath)
+        try:
+            entry = self._entry(fullpath)
+        except OSError as e:
+            LOG.info("Invalid command at '%s': %s", fullpath, e)
+            raise CommandNotFoundError(command_name, {fullpath: e}) from e
+
+        if entry.result is _UNSET:
+            entry.result = self._load(command_name, fullpath)
+
+        result = entry.result
+        if isinstance(result, Exception):
+            raise CommandNotFoundError(command_name, {fullpath: result}) from result
+        return result
+
+    @classmethod
+    def _load(cls, command_name, fullpath):
+        """Returns the `CLICommand` class or the exception raised loading it."""
         try:
             # We inspect the AST of the python file without importing it because
             # we don't want to accidentally execute a python script someone has
             # sitting in their command path, so we inspect the AST to see if it
             # contains a class definition of CLICommand.
-            if not self._contains_awsrun_command(fullpath):
+            if not cls._contains_awsrun_command(fullpath):
                 raise Exception("CLICommand class not found")
 
             # Now we will import the module as we know the file is likely an
             # awsrun command given it contains a CLICommand class.
-            module = importlib.import_module(command_name)
+            module = _import_module(command_name)
 
             # All Commands must define an 'CLICommand' class as this is the
             # contract that we have defined as part of the command system.
             return module.CLICommand
 
-        except Exception as e:
+        except Exception as e:  # pylint: disable=broad-except
             LOG.info("Invalid command at '%s': %s", fullpath, e)
-            raise CommandNotFoundError(command_name, {fullpath: e}) from e
+            return e
 
     def load_all(self):
         classes = {}
-        LOG.info("scanning directory '%s' for commands", self.path)
-        for fn in os.listdir(self.path):
-            if fn.startswith("__") or not fn.endswith(".py"):
-                continue
-
-            name = fn.split(".py")[0]
+        for name in self.load_names():
             with contextlib.suppress(Exception):
                 classes[name] = self.load(name)
 
         return classes
 
+    def load_docs(self):
+        docs = {}
+        for name in self.load_names():
+            fullpath = os.path.join(self.path, name) + ".py"
+            try:
+                entry = self._entry(fullpath)
+            except OSError:
+                continue
+
+            # If the command has been loaded, we know whether it is valid, so
+            # there is no need to inspect its source.
+            if entry.result is not _UNSET:
+                if not isinstance(entry.result, Exception):
+                    docs[name] = entry.result.__doc__
+                continue
+
+            if entry.doc is _UNSET:
+                entry.doc = _inspect_command(fullpath)
+            if not isinstance(entry.doc, Exception):
+                docs[name] = entry.doc
+
+        return docs
+
+    def load_names(self):
+        LOG.info("scanning directory '%s' for commands", self.path)
+        # DirEntry.is_file uses the file type returned when reading the
+        # directory, so non-files are skipped without an extra stat call.
+        with os.scandir(self.path) as entries:
+            filenames = [e.name for e in entries if e.is_file()]
+
+        names = {
+            fn.split(".py")[0]
+            for fn in filenames
+            if not fn.startswith("__") and fn.endswith(".py")
+        }
+
+        # Forget files that have been removed since the last scan.
+        fullpaths = {os.path.join(self.path, fn) for fn in filenames}
+        for fullpath in self._cache.keys() - fullpaths:
+            del self._cache[fullpath]
+
+        return names
+
+    def _entry(self, fullpath):
+        """Returns the `_CacheEntry` for the current contents of `fullpath`.
+
+        A new entry replaces the cached one if the file has been modified since.
+        Raises `OSError` if the file does not exist.
+        """
+        st = os.stat(fullpath)
+        key = (st.st_mtime_ns, st.st_size)
+        entry = self._cache.get(fullpath)
+        if entry is None or entry.key != key:
+            entry = self._cache[fullpath] = _CacheEntry(key)
+        return entry
+
     @staticmethod
     def _contains_awsrun_command(filename):
-        with open(filename, encoding="utf-8") as f:
-            node = ast.parse(f.read(), filename)
-        return any(
-            n.name == "CLICommand" for n in node.body if isinstance(n, ast.ClassDef)
-        )
+        return _parse_command(filename)[1] is not None
 
 
 class ModuleLoader(CommandLoader):
@@ -293,29 +424,229 @@ class ModuleLoader(CommandLoader):
     def __init__(self, module_name):
         self.module_name = module_name
 
+        # Maps a command name to its class or the exception raised loading
+        # it. Modules are never reloaded once imported, so the outcomes do not
+        # change for the life of the loader.
+        self._classes = {}
+
+        # Maps a command name to its docstring or the exception explaining why
+        # it cannot be loaded, as determined without importing it.
+        self._docs = {}
+
+        # The names of the modules in the package. Installed packages do not
+        # change while awsrun runs, so they are only listed once.
+        self._names = None
+
     def load(self, command_name):
+        if command_name not in self._classes:
+            self._classes[command_name] = self._load(command_name)
+
+        result = self._classes[command_name]
+        if isinstance(result, Exception):
+            raise CommandNotFoundError(
+                command_name, {self.module_name: result}
+            ) from result
+        return result
+
+    def _load(self, command_name):
+        """Returns the `CLICommand` class or the exception raised loading it."""
         try:
             path = f"{self.module_name}.{command_name}"
             LOG.info("loading command at '%s'", path)
-            module = importlib.import_module(path)
+            module = _import_module(path)
 
             # All Commands must define an 'CLICommand' class as this is the
             # contract that we have defined as part of the command system.
             return module.CLICommand
 
-        except Exception as e:
-            raise CommandNotFoundError(command_name, {self.module_name: e}) from e
+        except Exception as e:  # pylint: disable=broad-except
+            return e
 
     def load_all(self):
         classes = {}
-        base = importlib.import_module(self.module_name)
-
-        for m in pkgutil.iter_modules(base.__path__):
+        for name in self.load_names():
             with contextlib.suppress(Exception):
-                classes[m.name] = self.load(m.name)
+                classes[name] = self.load(name)
 
         return classes
 
+    def load_docs(self):
+        docs = {}
+        for name in self.load_names():
+            # If the command has been loaded, we know whether it is valid, so
+            # there is no need to inspect its source.
+            result = self._classes.get(name)
+            if result is not None:
+                if not isinstance(result, Exception):
+                    docs[name] = result.__doc__
+                continue
+
+            if name not in self._docs:
+                self._docs[name] = self._inspect(name)
+            if not isinstance(self._docs[name], Exception):
+                docs[name] = self._docs[name]
+
+        return docs
+
+    def _inspect(self, command_name):
+        """Returns the docstring of the command or why it cannot be loaded.
+
+        The docstring is read from the source of the module, so it isn't
+        imported. If there is no source, we must import it.
+        """
+        try:
+            spec = importlib.util.find_spec(f"{self.module_name}.{command_name}")
+        except Exception as e:  # pylint: disable=broad-except
+            return e
+
+        if spec.origin and spec.origin.endswith(".py"):
+            return _inspect_command(spec.origin)
+
+        try:
+            return self.load(command_name).__doc__
+        except CommandNotFoundError as e:
+            return e
+
+    def load_names(self):
+        if self._names is None:
+            base = _import_module(self.module_name)
+            self._names = frozenset(m.name for m in pkgutil.iter_modules(base.__path__))
+        return self._names
+
+
+# Marks a value in a `_CacheEntry` that has not been determined yet.
+_UNSET = object()
+
+
+class _CacheEntry:
+    """Cached outcomes for the contents of a command file.
+
+    `key` is the (mtime_ns, size) of the file. `doc` is the `CLICommand`
+    docstring or the exception explaining why the command cannot be loaded, as
+    determined without importing it. `result` is the `CLICommand` class or the
+    exception raised when it was loaded.
+    """
+
+    __slots__ = ("key", "doc", "result")
+
+    def __init__(self, key):
+        self.key = key
+        self.doc = _UNSET
+        self.result = _UNSET
+
+
+def _parse_command(filename):
+    """Returns the AST of `filename` and the node of its `CLICommand` class.
+
+    Returns (None, None) if the file does not define a top-level `CLICommand`
+    class. The file is parsed, but it is never executed.
+    """
+    with open(filename, "rb") as f:
+        source = f.read()
+
+    # Building an AST is far more expensive than a regex scan, so only parse
+    # the files that might define a CLICommand class. The parse rules out
+    # matches inside of strings and comments.
+    if not _CLICOMMAND_RE.search(source):
+        return None, None
+
+    tree = ast.parse(source.decode("utf-8"), filename)
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "CLICommand":
+            return tree, node
+    return None, None
+
+
+def _inspect_command(filename):
+    """Returns the `CLICommand` docstring in `filename` without executing it.
+
+    If the file does not define a `CLICommand` class, or the top-level package
+    of a module it requires cannot be found, the exception explaining why the
+    command cannot be loaded is returned instead, so either outcome can be
+    cached. This is only a prefilter, as the command may still fail to import.
+    """
+    try:
+        tree, node = _parse_command(filename)
+        if node is None:
+            raise Exception("CLICommand class not found")
+
+        for name in _required_modules(tree):
+            if name not in sys.modules and importlib.util.find_spec(name) is None:
+                raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+        return _docstring(node)
+
+    except Exception as e:  # pylint: disable=broad-except
+        return e
+
+
+def _required_modules(tree):
+    """Yields the top-level names of the modules the module `tree` requires.
+
+    These are the absolute imports at the top level of the module, including
+    those in a try block whose exception handlers all exit or raise, which is
+    how the built-in commands report missing optional dependencies. Imports
+    with a fallback or inside of functions are not required. Only top-level
+    names are returned, as finding a submodule would import its parents.
+    """
+    for stmt in tree.body:
+        stmts = [stmt]
+        if isinstance(stmt, ast.Try) and all(map(_exits, stmt.handlers)):
+            stmts = stmt.body
+
+        for s in stmts:
+            if isinstance(s, ast.Import):
+                for alias in s.names:
+                    yield alias.name.partition(".")[0]
+            elif isinstance(s, ast.ImportFrom) and s.level == 0:
+                yield s.module.partition(".")[0]
+
+
+def _exits(handler):
+    """Returns True if the exception `handler` ends by raising or exiting."""
+    last = handler.body[-1]
+    if isinstance(last, ast.Raise):
+        return True
+    if isinstance(last, ast.Expr) and isinstance(last.value, ast.Call):
+        func = last.value.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")
+        return name == "exit"
+    return False
+
+
+def _docstring(node):
+    """Returns the docstring of the class `node` as its `__doc__` would be.
+
+    From Python 3.13, the compiler strips the indentation of docstrings, so
+    the docstring is compiled in an empty copy of the class rather than read
+    from the AST. Without bases, decorators, or other statements, executing
+    the copy does not run any of the command's code.
+    """
+    if ast.get_docstring(node, clean=False) is None:
+        return None
+
+    cls = copy.copy(node)
+    cls.bases, cls.keywords, cls.decorator_list = [], [], []
+    cls.body = node.body[:1]
+    namespace = {}
+    exec(  # pylint: disable=exec-used
+        compile(ast.Module(body=[cls], type_ignores=[]), "<docstring>", "exec"),
+        namespace,
+    )
+    return namespace[node.name].__doc__
+
+
+def _import_module(name):
+    """Returns the module called `name`, importing it if needed.
+
+    Modules that have already been imported are returned straight from
+    `sys.modules` without entering the import machinery and its locks.
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+    return module
+
 
 class CommandNotFoundError(Exception):
     """Raised if command cannot be found.
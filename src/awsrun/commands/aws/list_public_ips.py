@@ -54,27 +54,33 @@ class CLICommand(RegionalCommand):
         out = io.StringIO()
         ec2 = session.resource("ec2", region_name=region)
 
+        # Describe all of the network interfaces in the region at once rather
+        # than once per VPC, and then group them by VPC. The VPC owners are
+        # still needed as a VPC might be shared with the account.
+        owners = {vpc.id: vpc.owner_id for vpc in ec2.vpcs.all()}
         public_ips = defaultdict(list)
-        for vpc in ec2.vpcs.all():
-            for ni in vpc.network_interfaces.all():
-                # I've opened a bug report for boto3 as the following lines
-                # should, in my opinion, find all public IPs. For some reason
-                # the association reference is None in some cases when the
-                # association_attribute contains an association:
-                # https://github.com/boto/boto3/issues/2180
-                #
-                # if ni.association:
-                #     public_ips[vpc.id].append(ni.association.public_ip)
-
-                if ni.association_attribute:
-                    ip = ni.association_attribute.get("PublicIp")
-                    if ip:
-                        public_ips[(vpc.id, vpc.owner_id)].append(ip)
+        for ni in ec2.network_interfaces.all():
+            # I've opened a bug report for boto3 as the following lines
+            # should, in my opinion, find all public IPs. For some reason
+            # the association reference is None in some cases when the
+            # association_attribute contains an association:
+            # https://github.com/boto/boto3/issues/2180
+            #
+            # if ni.association:
+            #     public_ips[ni.vpc_id].append(ni.association.public_ip)
+
+            if ni.association_attribute and ni.vpc_id in owners:
+                ip = ni.association_attribute.get("PublicIp")
+                if ip:
+                    public_ips[ni.vpc_id].append(ip)
 
         # We include the owner id in the output as sometimes a VPC has been
         # shared, so the owner is not necessarily the same as the account we
         # are processing.
-        for (vpc_id, owner_id), ips in public_ips.items():
+        for vpc_id, owner_id in owners.items():
+            ips = public_ips.get(vpc_id)
+            if not ips:
+                continue
             print(
                 f'{acct}/{region}: id={vpc_id} owner={owner_id} ips={", ".join(ips)}',
                 file=out,
@@ -76,6 +76,13 @@ from pathlib import Path
 
 import yaml
 
+# Use the libyaml-based loader when PyYAML was built with it as it is
+# considerably faster than the pure-Python implementation.
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 LOG = logging.getLogger(__name__)
 
 # pylint: disable=unidiomatic-typecheck
@@ -212,7 +219,7 @@ class YAMLConfig(Config):
     """Loads a YAML configuration from a stream."""
 
     def __init__(self, stream):
-        super().__init__(yaml.safe_load(stream))
+        super().__init__(yaml.load(stream, Loader=_YAMLLoader))
 
 
 class JSONConfig(Config):
@@ -206,10 +206,12 @@ process. In addition, the other difference is the region parameter on the
 
 import functools
 import logging
+import os
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from typing import Callable
 
 from awsrun.argparse import AppendWithoutDefault
@@ -218,6 +220,9 @@ from awsrun.session import SessionProvider
 
 LOG = logging.getLogger(__name__)
 
+# Number of jobs per worker that AccountRunner keeps queued in its thread pool.
+_SUBMIT_WINDOW_FACTOR = 4
+
 
 class Command:
     """Abstract base class that represents a command to execute on an account.
@@ -960,7 +965,14 @@ class AccountRunner:
         start = time.time()
         cmd.pre_hook_with_context(context)
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+        # The worker count also sizes the submit window below, so resolve the
+        # executor's default for None here rather than reading it back from the
+        # pool. This is the default ThreadPoolExecutor uses from Python 3.8.
+        max_workers = self.max_workers
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
             # The worker task processes a single account. The worker task takes
             # care to capture the result of the command's execute method. We
             # don't want a poorly written command that raises an exception to
@@ -982,17 +994,30 @@ class AccountRunner:
                     # session for the account.
                     return _wrap_exception(e)
 
-            # Submit all of the jobs for execution to the thread pool.
-            f2a = {pool.submit(worker_task, a): a for a in accounts}
+            # Rather than creating a future for every account upfront, only a
+            # bounded window of jobs is submitted to the thread pool. As jobs
+            # complete, more are submitted, which keeps the workers busy while
+            # limiting the bookkeeping when processing thousands of accounts.
+            remaining = iter(accounts)
+            f2a = {}
+
+            def submit(count):
+                for acct in islice(remaining, count):
+                    f2a[pool.submit(worker_task, acct)] = acct
+
+            submit(max_workers * _SUBMIT_WINDOW_FACTOR)
 
             # NOTE: collect_results is called by the main thread sequentially
             # after each worker completes their task. This is a guarantee for
             # Command authors as it allows them to safely update instance vars
             # in the Command because it is not safe to do so in the execute
             # method which is invoked in a concurrently running worker thread.
-            for future in as_completed(f2a):
-                acct = f2a[future]
-                cmd.collect_results(acct, future.result())
+            while f2a:
+                done, _ = wait(f2a, return_when=FIRST_COMPLETED)
+                for future in done:
+                    acct = f2a.pop(future)
+                    cmd.collect_results(acct, future.result())
+                submit(len(done))
 
         cmd.post_hook()
         return time.time() - start
@@ -76,8 +76,7 @@ def yaml_string():
 @pytest.fixture()
 def _json_cache(tmpdir):
     with open(tmpdir.join("awsrun.dat"), "w", encoding="utf-8") as f:
-        f.write(
-            """
+        f.write("""
     [
         {
             "id": "100200300400",
@@ -95,8 +94,7 @@ def _json_cache(tmpdir):
             "status": "suspended"
         }
     ]
-    """
-        )
+    """)
 
 
 @pytest.mark.parametrize("max_age", [0, 300])
@@ -381,3 +379,91 @@ def test_yaml_account_loader_with_file_url(
 
     (accts,), _ = mock_mal.call_args
     assert accts == expected_from_loader
+
+
+def test_json_loader_revalidates_expired_cache(tmpdir, mocker, expected_from_loader):
+    mock_resp = mocker.Mock()
+    mock_resp.status_code = 200
+    mock_resp.headers = {"ETag": '"v1"'}
+    mock_resp.json.return_value = expected_from_loader
+    mock_get = mocker.patch("requests.Session.get", return_value=mock_resp)
+    mocker.patch("tempfile.gettempdir", return_value=tmpdir)
+
+    url = "http://example.com/acct.json"
+    acctload.JSONAccountLoader(url, max_age=86400)
+
+    # Expire the cache and have the server report the data is unchanged
+    not_modified = mocker.Mock()
+    not_modified.status_code = 304
+    mock_get.return_value = not_modified
+    mock_resp.json.reset_mock()
+
+    with freeze_time(datetime.now(timezone.utc) + timedelta(days=1, seconds=5)):
+        loader = acctload.JSONAccountLoader(url, max_age=86400)
+
+    # The ETag from the first response should be sent and the cached data reused
+    _, kwargs = mock_get.call_args
+    assert kwargs["headers"] == {"If-None-Match": '"v1"'}
+    not_modified.raise_for_status.assert_not_called()
+    mock_resp.json.assert_not_called()
+    assert [a.id for a in loader.accounts()] == [a["id"] for a in expected_from_loader]
+
+
+def test_json_loader_ignores_incomplete_validators(
+    tmpdir, mocker, expected_from_loader
+):
+    mock_resp = mocker.Mock()
+    mock_resp.status_code = 200
+    mock_resp.headers = {"ETag": '"v1"'}
+    mock_resp.json.return_value = expected_from_loader
+    mock_get = mocker.patch("requests.Session.get", return_value=mock_resp)
+    mocker.patch("tempfile.gettempdir", return_value=tmpdir)
+
+    url = "http://example.com/acct.json"
+    acctload.JSONAccountLoader(url, max_age=86400)
+    (meta,) = Path(tmpdir).glob("*.meta")
+    meta.write_text("{}")
+
+    with freeze_time(datetime.now(timezone.utc) + timedelta(days=1, seconds=5)):
+        loader = acctload.JSONAccountLoader(url, max_age=86400)
+
+    # The validators do not apply, so an unconditional request is made
+    _, kwargs = mock_get.call_args
+    assert kwargs["headers"] == {}
+    assert [a.id for a in loader.accounts()] == [a["id"] for a in expected_from_loader]
+
+
+def test_json_loader_refetches_when_cache_removed_before_304(
+    tmpdir, mocker, expected_from_loader
+):
+    mock_resp = mocker.Mock()
+    mock_resp.status_code = 200
+    mock_resp.headers = {"ETag": '"v1"'}
+    mock_resp.json.return_value = expected_from_loader
+    mock_get = mocker.patch("requests.Session.get", return_value=mock_resp)
+    mocker.patch("tempfile.gettempdir", return_value=tmpdir)
+
+    url = "http://example.com/acct.json"
+    acctload.JSONAccountLoader(url, max_age=86400)
+    (meta,) = Path(tmpdir).glob("*.meta")
+    cache = meta.with_suffix("")
+
+    # The cache is removed after the validators have been read
+    not_modified = mocker.Mock()
+    not_modified.status_code = 304
+
+    def remove_cache(*_, **kwargs):
+        if kwargs.get("headers"):
+            cache.unlink()
+            return not_modified
+        return mock_resp
+
+    mock_get.side_effect = remove_cache
+
+    with freeze_time(datetime.now(timezone.utc) + timedelta(days=1, seconds=5)):
+        loader = acctload.JSONAccountLoader(url, max_age=86400)
+
+    assert mock_get.call_count == 3
+    _, kwargs = mock_get.call_args
+    assert "headers" not in kwargs
+    assert [a.id for a in loader.accounts()] == [a["id"] for a in expected_from_loader]
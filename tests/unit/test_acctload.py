@@ -6,6 +6,8 @@
 
 # pylint: disable=redefined-outer-name,missing-docstring
 
+import json
+
 import pytest
 
 from awsrun import acctload
@@ -116,6 +118,66 @@ def test_meta_account_loader_accounts(
     assert acct_ids == expected
 
 
+def test_meta_account_loader_filters_preserve_order(many_acct_list):
+    mal = acctload.MetaAccountLoader(many_acct_list)
+    accts = mal.accounts(
+        acct_ids=["300400100200", "100200300400", "200300400100"],
+        include={"status": ["active", "suspended"]},
+        exclude={"env": ["nonprod"]},
+    )
+    assert [a.id for a in accts] == ["100200300400", "300400100200"]
+
+
+def test_meta_account_loader_filters_can_be_reused(many_acct_list):
+    mal = acctload.MetaAccountLoader(many_acct_list)
+    for _ in range(2):
+        accts = mal.accounts(
+            include={"status": ["active"]}, exclude={"status": ["suspended"]}
+        )
+        assert [a.id for a in accts] == ["100200300400", "200300400100"]
+
+
+def test_meta_account_loader_filters_with_unhashable_values():
+    d = [
+        {"id": "100200300400", "tags": ["a", "b"]},
+        {"id": "200300400100", "tags": "a"},
+        {"id": "300400100200", "tags": None},
+    ]
+    mal = acctload.MetaAccountLoader(d)
+    assert [a.id for a in mal.accounts(include={"tags": [["a", "b"]]})] == [
+        "100200300400"
+    ]
+    assert [a.id for a in mal.accounts(include={"tags": ["a"]})] == ["200300400100"]
+    assert [a.id for a in mal.accounts(exclude={"tags": [None]})] == [
+        "100200300400",
+        "200300400100",
+    ]
+
+
+def test_meta_account_loader_attributes():
+    d = [
+        {"id": "100200300400", "env": "prod", "status": "active"},
+        {"id": "200300400100", "env": "prod"},
+        {"id": "300400100200", "env": "dev", "status": "active"},
+    ]
+    attrs = acctload.MetaAccountLoader(d).attributes()
+    assert attrs == {
+        "id": {"100200300400", "200300400100", "300400100200"},
+        "env": {"prod", "dev"},
+        "status": {"active", None},
+    }
+
+
+def test_meta_account_loader_interns_string_values():
+    d = json.loads(
+        '[{"id": "100200300400", "env": "prod"}, {"id": "200300400100", "env": "prod"}]'
+    )
+    assert d[0]["env"] is not d[1]["env"]
+    mal = acctload.MetaAccountLoader(d)
+    a, b = mal.accounts()
+    assert a.env is b.env
+
+
 def test_meta_account_loader_filters_with_multi_word_attr_names():
     d = [
         {"id": "100200300400", "acct status": "active account"},
@@ -98,3 +98,25 @@ def test_append_attribute_value_pair_action_failure(args, expected_exception):
     parser.add_argument("--flag", "-f", action=AppendAttributeValuePair)
     with pytest.raises(expected_exception):
         parser.parse_args(args.split())
+
+
+def test_append_without_default_action_reuse_parser():
+    default = ["east"]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--region", action=AppendWithoutDefault, default=default)
+    assert parser.parse_args("--region west".split()).region == ["west"]
+    assert parser.parse_args("--region central".split()).region == ["central"]
+    assert parser.parse_args([]).region == ["east"]
+    assert default == ["east"]
+
+
+def test_append_attribute_value_pair_action_does_not_mutate_default():
+    default = {"env": ["prod"]}
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--flag", "-f", action=AppendAttributeValuePair, default=default
+    )
+    for _ in range(2):
+        args = parser.parse_args("-f env=dev -f status=active".split())
+        assert args.flag == {"env": ["prod", "dev"], "status": ["active"]}
+    assert default == {"env": ["prod"]}
@@ -6,11 +6,13 @@
 
 # pylint: disable=redefined-outer-name,missing-docstring
 
+import math
 import os
 import random
 import time
 from datetime import timedelta
 
+import pytest
 from freezegun import freeze_time
 
 from awsrun import cache
@@ -92,3 +94,57 @@ def test_persistent_expiring_value_no_caching(tmp_path):
     assert not cache_file.exists()
 
     assert len({value1, value2, value3}) == 3, "values should not be cached"
+
+
+def test_persistent_expiring_value_leaves_no_tmp_files(tmp_path):
+    cache_file = tmp_path / "test.dat"
+    ev = cache.PersistentExpiringValue(random.random, cache_file, max_age=300)
+    ev.value(refresh=True)
+    ev.value(refresh=True)
+    assert [p.name for p in tmp_path.iterdir()] == ["test.dat"]
+
+
+def test_persistent_expiring_value_unserializable(tmp_path):
+    cache_file = tmp_path / "test.dat"
+    ev = cache.PersistentExpiringValue(object, cache_file, max_age=300)
+    with pytest.raises(TypeError):
+        ev.value()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_persistent_expiring_value_syncs_before_replace(tmp_path, mocker):
+    calls = []
+    mocker.patch("os.fsync", side_effect=lambda fd: calls.append("fsync"))
+    replace = os.replace
+    mocker.patch(
+        "os.replace", side_effect=lambda *a: calls.append("replace") or replace(*a)
+    )
+
+    cache_file = tmp_path / "test.dat"
+    cache.PersistentExpiringValue(lambda: 1, cache_file, max_age=300).value()
+    assert calls == ["fsync", "replace"]
+    assert cache_file.read_text() == "1"
+
+
+def test_persistent_expiring_value_skips_disabled_debug_log(tmp_path, mocker):
+    cache_file = tmp_path / "test.dat"
+    ev = cache.PersistentExpiringValue(lambda: 1, cache_file, max_age=300)
+    ev.value()
+
+    mocker.patch.object(cache.LOG, "isEnabledFor", return_value=False)
+    debug = mocker.patch.object(cache.LOG, "debug")
+    assert ev.value() == 1
+    ev.value(refresh=True)
+    debug.assert_not_called()
+
+
+def test_persistent_expiring_value_non_finite_and_large_values(tmp_path):
+    cache_file = tmp_path / "test.dat"
+    value = {"nan": float("nan"), "inf": float("inf"), "big": 2**70}
+    ev = cache.PersistentExpiringValue(lambda: value, cache_file, max_age=300)
+    ev.value()
+
+    cached = ev.value()
+    assert math.isnan(cached["nan"])
+    assert cached["inf"] == float("inf")
+    assert cached["big"] == 2**70
@@ -0,0 +1,210 @@
+#
+# Copyright 2019 FMR LLC <opensource@fidelity.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+# pylint: disable=redefined-outer-name,missing-docstring,protected-access
+
+import io
+import json
+import os
+
+import pytest
+import yaml
+
+from awsrun import __version__, cli
+
+
+@pytest.fixture
+def yaml_config(tmp_path):
+    filename = tmp_path / "awsrun.yaml"
+    with filename.open("w") as f:
+        yaml.dump({"CLI": {"threads": 5, "account": ["100200300400"]}}, f)
+    return filename
+
+
+def test_load_config_writes_cache(yaml_config):
+    config = cli._load_config(yaml_config)
+    assert config.get("CLI", "threads") == 5
+
+    cache_file = yaml_config.with_name(yaml_config.name + ".cache.json")
+    with cache_file.open() as f:
+        assert json.load(f)["config"] == config.conf
+
+
+def test_load_config_uses_cache(yaml_config):
+    cli._load_config(yaml_config)
+
+    # Tamper with the cache to prove it is read instead of the YAML
+    cache_file = yaml_config.with_name(yaml_config.name + ".cache.json")
+    with cache_file.open() as f:
+        cached = json.load(f)
+    cached["config"]["CLI"]["threads"] = 99
+    with cache_file.open("w") as f:
+        json.dump(cached, f)
+
+    assert cli._load_config(yaml_config).get("CLI", "threads") == 99
+
+
+def test_load_config_ignores_stale_cache(yaml_config):
+    cli._load_config(yaml_config)
+
+    with yaml_config.open("w") as f:
+        yaml.dump({"CLI": {"threads": 20}}, f)
+    st = yaml_config.stat()
+    os.utime(yaml_config, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert cli._load_config(yaml_config).get("CLI", "threads") == 20
+
+
+def test_load_config_detects_edit_with_same_size_and_mtime(tmp_path):
+    filename = tmp_path / "awsrun.yaml"
+    filename.write_text("CLI:\n  threads: 5\n")
+    st = filename.stat()
+    cli._load_config(filename)
+
+    filename.write_text("CLI:\n  threads: 6\n")
+    os.utime(filename, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert cli._load_config(filename).get("CLI", "threads") == 6
+
+
+def _tamper_with_cache(yaml_config):
+    cache_file = yaml_config.with_name(yaml_config.name + ".cache.json")
+    cached = json.loads(cache_file.read_text())
+    cached["config"]["CLI"]["cmd_path"] = ["/planted"]
+    cache_file.write_text(json.dumps(cached))
+    return cache_file
+
+
+def test_load_config_ignores_group_writable_cache(yaml_config):
+    cli._load_config(yaml_config)
+    _tamper_with_cache(yaml_config).chmod(0o664)
+
+    assert cli._load_config(yaml_config).get("CLI", "cmd_path") is None
+
+
+def test_load_config_ignores_foreign_owned_cache(yaml_config, mocker):
+    cli._load_config(yaml_config)
+    cache_file = _tamper_with_cache(yaml_config)
+    mtime = cache_file.stat().st_mtime_ns
+    mocker.patch("os.getuid", return_value=os.getuid() + 1)
+
+    assert cli._load_config(yaml_config).get("CLI", "cmd_path") is None
+
+    # The directory isn't owned by the user either, so the cache isn't rewritten
+    assert cache_file.stat().st_mtime_ns == mtime
+
+
+def test_load_config_ignores_corrupt_cache(yaml_config):
+    cache_file = yaml_config.with_name(yaml_config.name + ".cache.json")
+    cache_file.write_text("not json")
+    assert cli._load_config(yaml_config).get("CLI", "threads") == 5
+
+
+def test_load_config_skips_cache_for_non_json_values(tmp_path):
+    filename = tmp_path / "awsrun.yaml"
+    filename.write_text("CLI:\n  threads: 5\nCommands:\n  1: 2019-01-01\n")
+    config = cli._load_config(filename)
+    assert config.get("CLI", "threads") == 5
+    assert not filename.with_name(filename.name + ".cache.json").exists()
+
+
+def test_load_config_missing_file(tmp_path):
+    config = cli._load_config(tmp_path / "missing.yaml")
+    assert config.get("CLI", "threads") is None
+
+
+def test_read_account_file():
+    f = io.StringIO("# comment\n100200300400\n\n  \n 200300400100 \n300400100200")
+    assert cli._read_account_file(f) == [
+        "100200300400",
+        "200300400100",
+        "300400100200",
+    ]
+
+
+def test_version_does_not_load_config(mocker, capsys):
+    mocker.patch("sys.argv", ["/usr/local/bin/awsrun", "--version"])
+    load_config = mocker.patch("awsrun.cli._load_config")
+
+    with pytest.raises(SystemExit) as e:
+        cli._cli(cli._CSP("aws"))
+
+    assert e.value.code == 0
+    assert capsys.readouterr().out == f"awsrun {__version__}\n"
+    load_config.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "prog_name, expected",
+    [
+        ("awsrun", "aws"),
+        ("/usr/local/bin/awsrun", "aws"),
+        ("/usr/local/bin/azurerun", "azure"),
+    ],
+)
+def test_csp_from_prog_name(prog_name, expected):
+    assert cli._CSP.from_prog_name(prog_name).name == expected
+
+
+@pytest.mark.parametrize("prog_name", ["/usr/local/bin/gcprun", "runaws", "awsrunrun"])
+def test_csp_from_prog_name_unknown_variant(prog_name):
+    with pytest.raises(Exception, match="unknown variant"):
+        cli._CSP.from_prog_name(prog_name)
+
+
+def test_print_metadata_values(mocker):
+    loader = mocker.Mock()
+    loader.attributes.return_value = {"env": {"prod", None, "dev"}, "n": {2, 1}}
+
+    out = io.StringIO()
+    cli._print_metadata(loader, "env", out=out)
+    assert out.getvalue() == "Metadata values for 'env' attribute:\n\ndev\nprod\n"
+
+    out = io.StringIO()
+    cli._print_metadata(loader, True, out=out)
+    assert out.getvalue() == "Valid metadata attributes:\n\nenv\nn\n"
+
+
+def test_ask_for_confirmation_without_answer(mocker, capsys):
+    mocker.patch("builtins.input", side_effect=EOFError)
+    with pytest.raises(SystemExit) as e:
+        cli._ask_for_confirmation(["100200300400", "200300400100"])
+    assert e.value.code == 1
+    assert "--force" in capsys.readouterr().err
+
+
+def test_print_valid_commands():
+    out = io.StringIO()
+    cli._print_valid_commands({"longer": None, "a": "Short command."}, out=out)
+    assert out.getvalue() == (
+        "The following are the available commands:\n\n"
+        "a       Short command.\n"
+        "longer  \n\n"
+    )
+
+
+def test_csp_config_filename(mocker, tmp_path):
+    mocker.patch.dict("os.environ", {"AWSRUN_CONFIG": "/tmp/custom.yaml"})
+    home = mocker.patch("pathlib.Path.home", return_value=tmp_path)
+    assert cli._CSP("aws").config_filename() == "/tmp/custom.yaml"
+    home.assert_not_called()
+
+    assert cli._CSP("azure").config_filename() == tmp_path / ".azurerun.yaml"
+
+
+def test_load_config_honors_registered_filetype(tmp_path, mocker):
+    class CustomConfig(cli.Config):
+        def __init__(self, stream):
+            super().__init__({"CLI": {"threads": len(stream.read())}})
+
+    mocker.patch.dict(cli.Config._filetypes, {".yaml": CustomConfig})
+    filename = tmp_path / "awsrun.yaml"
+    filename.write_text("CLI:\n  threads: 5\n")
+
+    config = cli._load_config(filename)
+    assert isinstance(config, CustomConfig)
+    assert config.get("CLI", "threads") == len("CLI:\n  threads: 5\n")
+    assert not filename.with_name(filename.name + ".cache.json").exists()
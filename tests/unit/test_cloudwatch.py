@@ -0,0 +1,180 @@
+#
+# Copyright 2019 FMR LLC <opensource@fidelity.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+# pylint: disable=redefined-outer-name,missing-docstring,protected-access
+
+import math
+import weakref
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from freezegun import freeze_time
+
+from awsrun.cloudwatch import CWMetrics
+
+NOW = datetime(2019, 7, 13, 15, 4, 40, tzinfo=timezone.utc)
+
+
+def _page(results):
+    return {
+        "MetricDataResults": [
+            {
+                "Id": metric_id,
+                "Label": metric_id,
+                "StatusCode": "Complete",
+                "Timestamps": [ts for ts, _ in points],
+                "Values": [v for _, v in points],
+            }
+            for metric_id, points in results.items()
+        ]
+    }
+
+
+@pytest.fixture
+def client(mocker):
+    client = mocker.Mock()
+    client.get_metric_data.return_value = {"MetricDataResults": []}
+    return client
+
+
+def _set_pages(client, *pages):
+    # Every page but the last includes a token to request the next page
+    for i, page in enumerate(pages[:-1]):
+        page["NextToken"] = f"token{i}"
+    client.get_metric_data.side_effect = list(pages)
+
+
+@freeze_time(NOW)
+def test_bulk_load_aligns_values_and_fills_gaps(client):
+    cwm = CWMetrics(client, last=600, samples=10)
+    get_values = cwm.add_metric("AWS/DX", "Bps", {"ConnectionId": "dx"}, "Average")
+
+    beg, _ = cwm._compute_datetime_range()
+    ticks = [beg + timedelta(minutes=i) for i in range(10)]
+
+    # Results span two pages and are missing the first and sixth data points
+    _set_pages(
+        client,
+        _page({"id1": [(ticks[1], 1.0), (ticks[2], 2.0), (ticks[3], 3.0)]}),
+        _page({"id1": [(ticks[4], 4.0)] + [(t, 9.0) for t in ticks[6:]]}),
+    )
+    cwm.bulk_load()
+
+    calls = client.get_metric_data.call_args_list
+    assert "NextToken" not in calls[0][1]
+    assert calls[1][1]["NextToken"] == "token0"
+
+    results = list(get_values())
+    assert [ts for ts, _ in results] == ticks
+    values = [v for _, v in results]
+    assert math.isnan(values[0]) and math.isnan(values[5])
+    assert values[1:5] == [1.0, 2.0, 3.0, 4.0]
+    assert values[6:] == [9.0] * 4
+
+
+@freeze_time(NOW)
+def test_bulk_load_without_data(client):
+    cwm = CWMetrics(client, last=600, samples=10)
+    get_values = cwm.add_metric("AWS/DX", "Bps", {"ConnectionId": "dx"}, "Average")
+    cwm.bulk_load()
+    assert not list(get_values())
+
+
+@freeze_time(NOW)
+def test_bulk_load_replaces_prior_results(client):
+    cwm = CWMetrics(client, last=600, samples=10)
+    get_values = cwm.add_metric("AWS/DX", "Bps", {"ConnectionId": "dx"}, "Average")
+    beg, _ = cwm._compute_datetime_range()
+
+    _set_pages(client, _page({"id1": [(beg, 1.0)]}))
+    cwm.bulk_load()
+    _set_pages(client, _page({"id1": [(beg, 2.0)]}))
+    cwm.bulk_load()
+
+    assert next(get_values()) == (beg, 2.0)
+
+
+def test_bulk_load_without_metrics(client):
+    CWMetrics(client).bulk_load()
+    client.get_metric_data.assert_not_called()
+
+
+def test_bulk_load_single_chunk(client):
+    cwm = CWMetrics(client)
+    for i in range(500):
+        cwm.add_metric("AWS/DX", "Bps", {"ConnectionId": f"dx{i}"}, "Average")
+    cwm.bulk_load()
+    assert client.get_metric_data.call_count == 1
+    assert len(client.get_metric_data.call_args[1]["MetricDataQueries"]) == 500
+
+
+@freeze_time(NOW)
+def test_bulk_load_splits_into_chunks(client):
+    cwm = CWMetrics(client, last=600, samples=10)
+    getters = [
+        cwm.add_metric("AWS/DX", "Bps", {"ConnectionId": f"dx{i}"}, "Average")
+        for i in range(1201)
+    ]
+    beg, _ = cwm._compute_datetime_range()
+
+    def get_metric_data(MetricDataQueries, **_):
+        ids = [q["Id"] for q in MetricDataQueries]
+        return _page({i: [(beg, float(i[2:]))] for i in ids})
+
+    client.get_metric_data.side_effect = get_metric_data
+    cwm.bulk_load()
+
+    calls = client.get_metric_data.call_args_list
+    sizes = sorted(len(c[1]["MetricDataQueries"]) for c in calls)
+    assert sizes == [201, 500, 500]
+    for i, get_values in enumerate(getters, 1):
+        assert next(get_values()) == (beg, float(i))
+
+
+@freeze_time(NOW)
+def test_add_metric_dedups_identical_metrics(client):
+    cwm = CWMetrics(client, last=600, samples=10)
+    get_a = cwm.add_metric("AWS/DX", "Bps", {"A": "a", "B": "b"}, "Average")
+    get_b = cwm.add_metric("AWS/DX", "Bps", {"B": "b", "A": "a"}, "Average")
+    get_max = cwm.add_metric("AWS/DX", "Bps", {"A": "a", "B": "b"}, "Maximum")
+
+    beg, _ = cwm._compute_datetime_range()
+    _set_pages(client, _page({"id1": [(beg, 1.0)], "id2": [(beg, 2.0)]}))
+    cwm.bulk_load()
+
+    queries = client.get_metric_data.call_args[1]["MetricDataQueries"]
+    assert [q["Id"] for q in queries] == ["id1", "id2"]
+    assert queries[0]["MetricStat"]["Metric"]["Dimensions"] == [
+        {"Name": "A", "Value": "a"},
+        {"Name": "B", "Value": "b"},
+    ]
+    assert next(get_a()) == next(get_b()) == (beg, 1.0)
+    assert next(get_max()) == (beg, 2.0)
+
+
+@pytest.mark.parametrize(
+    "last, samples, expected",
+    [
+        (3600, 60, 60),
+        (3600 * 16, 8, 7200),
+        (86400 * 30, 30, 86400),
+        (86400 * 90, 90, 86400),
+    ],
+)
+def test_compute_period(client, last, samples, expected):
+    assert CWMetrics(client, last=last, samples=samples)._period == expected
+
+
+def test_compute_period_less_than_ingestion_interval(client):
+    with pytest.raises(ValueError):
+        CWMetrics(client, last=60, samples=60)
+
+
+def test_instances_accept_attributes_and_weakrefs(client):
+    cwm = CWMetrics(client)
+    cwm.label = "dx"
+    assert cwm.label == "dx"
+    assert weakref.ref(cwm)() is cwm
@@ -0,0 +1,285 @@
+#
+# Copyright 2019 FMR LLC <opensource@fidelity.com>
+#
+# SPDX-License-Identifier: Apache-2.0
+#
+
+# pylint: disable=redefined-outer-name,missing-docstring,protected-access
+
+import os
+import sys
+
+import pytest
+
+from awsrun import cmdmgr
+from awsrun.runner import Command
+
+COMMAND = """
+from awsrun.runner import Command
+
+class CLICommand(Command):
+    def execute(self, session, acct):
+        return ""
+"""
+
+
+@pytest.fixture
+def cmd_dir(tmp_path):
+    (tmp_path / "cmdmgr_cached.py").write_text(COMMAND)
+    (tmp_path / "cmdmgr_invalid.py").write_text("x = 1\n")
+    (tmp_path / "cmdmgr_removed.py").write_text(COMMAND)
+    return tmp_path
+
+
+def test_directory_loader_load_all(cmd_dir):
+    loader = cmdmgr.DirectoryLoader(str(cmd_dir))
+    assert sorted(loader.load_all()) == ["cmdmgr_cached", "cmdmgr_removed"]
+
+
+def test_directory_loader_caches_by_mtime_and_size(cmd_dir, mocker):
+    loader = cmdmgr.DirectoryLoader(str(cmd_dir))
+    parse = mocker.spy(cmdmgr.DirectoryLoader, "_contains_awsrun_command")
+
+    loader.load_all()
+    assert parse.call_count == 3
+    loader.load_all()
+    assert parse.call_count == 3
+
+    with pytest.raises(cmdmgr.CommandNotFoundError):
+        loader.load("cmdmgr_invalid")
+    assert parse.call_count == 3
+
+    # Touching a file invalidates its entry
+    path = cmd_dir / "cmdmgr_invalid.py"
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    loader.load_all()
+    assert parse.call_count == 4
+
+
+def test_directory_loader_forgets_removed_files(cmd_dir):
+    loader = cmdmgr.DirectoryLoader(str(cmd_dir))
+    loader.load_all()
+    (cmd_dir / "cmdmgr_removed.py").unlink()
+
+    assert sorted(loader.load_all()) == ["cmdmgr_cached"]
+    assert str(cmd_dir / "cmdmgr_removed.py") not in loader._cache
+    with pytest.raises(cmdmgr.CommandNotFoundError):
+        loader.load("cmdmgr_removed")
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        (COMMAND, True),
+        ("@decorator\nclass CLICommand(Command):\n    pass\n", True),
+        ("x = 1\n", False),
+        ("def f():\n    class CLICommand:\n        pass\n", False),
+        ('"""\nclass CLICommand:\n"""\n', False),
+    ],
+)
+def test_contains_awsrun_command(tmp_path, source, expected):
+    path = tmp_path / "cmd.py"
+    path.write_text(source)
+    assert cmdmgr.DirectoryLoader._contains_awsrun_command(str(path)) == expected
+
+
+def test_contains_awsrun_command_skips_parse_without_match(tmp_path, mocker):
+    parse = mocker.patch("ast.parse")
+    path = tmp_path / "cmd.py"
+    path.write_text("x = 1\n")
+    assert not cmdmgr.DirectoryLoader._contains_awsrun_command(str(path))
+    parse.assert_not_called()
+
+
+def test_module_loader_caches_classes(tmp_path, monkeypatch, mocker):
+    pkg = tmp_path / "cmdmgr_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "cmd.py").write_text(COMMAND)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    loader = cmdmgr.ModuleLoader("cmdmgr_pkg")
+    cmd_class = loader.load("cmd")
+    assert loader.load_all() == {"cmd": cmd_class}
+    with pytest.raises(cmdmgr.CommandNotFoundError):
+        loader.load("missing")
+
+    iter_modules = mocker.patch("pkgutil.iter_modules")
+    import_module = mocker.patch("importlib.import_module")
+    assert loader.load("cmd") is cmd_class
+    assert loader.load_all() == {"cmd": cmd_class}
+    import_module.assert_not_called()
+    iter_modules.assert_not_called()
+
+
+def test_chain_loader_skips_shadowed_commands(tmp_path, mocker):
+    first_dir, second_dir = tmp_path / "first", tmp_path / "second"
+    first_dir.mkdir()
+    second_dir.mkdir()
+    (first_dir / "chain_shared.py").write_text(COMMAND)
+    (second_dir / "chain_shared.py").write_text(COMMAND)
+    (second_dir / "chain_second.py").write_text(COMMAND)
+
+    load = mocker.spy(cmdmgr.DirectoryLoader, "_load")
+    first = cmdmgr.DirectoryLoader(str(first_dir))
+    second = cmdmgr.DirectoryLoader(str(second_dir))
+    classes = cmdmgr.ChainLoader(first, second).load_all()
+
+    assert sorted(classes) == ["chain_second", "chain_shared"]
+    assert sorted(c[0][1] for c in load.call_args_list) == [
+        str(first_dir / "chain_shared.py"),
+        str(second_dir / "chain_second.py"),
+    ]
+
+
+def test_directory_loader_load_docs(tmp_path, mocker):
+    (tmp_path / "docs_cmd.py").write_text(
+        'import os\n\nclass CLICommand:\n    """Does things."""\n'
+    )
+    (tmp_path / "docs_nodoc.py").write_text("class CLICommand:\n    pass\n")
+    (tmp_path / "docs_invalid.py").write_text("x = 1\n")
+    (tmp_path / "docs_missing.py").write_text(
+        "import missing_dependency\n\nclass CLICommand:\n    pass\n"
+    )
+    (tmp_path / "docs_exits.py").write_text(
+        "import sys\n"
+        "try:\n    import missing_dependency\n"
+        "except ImportError:\n    sys.exit('install it')\n"
+        "\nclass CLICommand:\n    pass\n"
+    )
+    (tmp_path / "docs_optional.py").write_text(
+        "try:\n    import missing_dependency\n"
+        "except ImportError:\n    missing_dependency = None\n"
+        "\nclass CLICommand:\n    pass\n"
+    )
+
+    import_module = mocker.patch("importlib.import_module")
+    docs = cmdmgr.DirectoryLoader(str(tmp_path)).load_docs()
+    assert docs == {
+        "docs_cmd": "Does things.",
+        "docs_nodoc": None,
+        "docs_optional": None,
+    }
+    import_module.assert_not_called()
+
+
+def test_directory_loader_load_docs_corrected_by_load(tmp_path):
+    (tmp_path / "docs_fails.py").write_text(
+        "raise RuntimeError('boom')\n\nclass CLICommand:\n    pass\n"
+    )
+    loader = cmdmgr.DirectoryLoader(str(tmp_path))
+    # The prefilter cannot tell that the module raises on import.
+    assert loader.load_docs() == {"docs_fails": None}
+
+    with pytest.raises(cmdmgr.CommandNotFoundError):
+        loader.load("docs_fails")
+    assert loader.load_docs() == {}
+
+
+def test_directory_loader_caches_docs_by_mtime_and_size(tmp_path, mocker):
+    path = tmp_path / "docs_cached.py"
+    path.write_text('class CLICommand:\n    """One."""\n')
+    spy = mocker.spy(cmdmgr, "_inspect_command")
+    loader = cmdmgr.DirectoryLoader(str(tmp_path))
+
+    assert loader.load_docs() == {"docs_cached": "One."}
+    assert loader.load_docs() == {"docs_cached": "One."}
+    assert spy.call_count == 1
+
+    path.write_text('class CLICommand:\n    """Two!"""\n')
+    os.utime(path, ns=(0, 0))
+    assert loader.load_docs() == {"docs_cached": "Two!"}
+    assert spy.call_count == 2
+
+
+def test_chain_loader_load_docs_matches_load(tmp_path, monkeypatch):
+    first, second, pkg = tmp_path / "first", tmp_path / "second", tmp_path / "chain_pkg"
+    for d in (first, second, pkg):
+        d.mkdir()
+    (pkg / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    (first / "chain_docs_both.py").write_text('class CLICommand:\n    """First."""\n')
+    (second / "chain_docs_both.py").write_text('class CLICommand:\n    """Second."""\n')
+    (first / "chain_docs_broken.py").write_text(
+        'import missing_dependency\n\nclass CLICommand:\n    """First."""\n'
+    )
+    (pkg / "chain_docs_broken.py").write_text('class CLICommand:\n    """Module."""\n')
+
+    loader = cmdmgr.ChainLoader(
+        cmdmgr.DirectoryLoader(str(first)),
+        cmdmgr.DirectoryLoader(str(second)),
+        cmdmgr.ModuleLoader("chain_pkg"),
+    )
+    docs = loader.load_docs()
+    assert docs == {"chain_docs_both": "First.", "chain_docs_broken": "Module."}
+    for name, doc in docs.items():
+        assert loader.load(name).__doc__ == doc
+
+
+def test_module_loader_load_docs(tmp_path, monkeypatch):
+    pkg = tmp_path / "cmdmgr_docs_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "cmd.py").write_text('class CLICommand:\n    """Does things."""\n')
+    (pkg / "helper.py").write_text("x = 1\n")
+    (pkg / "missing.py").write_text(
+        "import missing_dependency\n\nclass CLICommand:\n    pass\n"
+    )
+    (pkg / "fails.py").write_text("raise RuntimeError\n\nclass CLICommand:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    loader = cmdmgr.ModuleLoader("cmdmgr_docs_pkg")
+    assert loader.load_docs() == {"cmd": "Does things.", "fails": None}
+    assert "cmdmgr_docs_pkg.cmd" not in sys.modules
+
+    with pytest.raises(cmdmgr.CommandNotFoundError):
+        loader.load("fails")
+    assert loader.load_docs() == {"cmd": "Does things."}
+
+
+class _StaticLoader(cmdmgr.CommandLoader):
+    def __init__(self, classes):
+        self.classes = classes
+
+    def load(self, command_name):
+        try:
+            return self.classes[command_name]
+        except KeyError as e:
+            raise cmdmgr.CommandNotFoundError(command_name, {"static": e}) from e
+
+    def load_all(self):
+        return dict(self.classes)
+
+
+def test_custom_loader_without_names_or_docs(tmp_path):
+    class CLICommand(Command):
+        """Does things."""
+
+        def execute(self, session, acct):
+            return ""
+
+    (tmp_path / "custom_shadowed.py").write_text(COMMAND)
+    static = _StaticLoader({"custom_cmd": CLICommand, "custom_shadowed": CLICommand})
+
+    mgr = cmdmgr.CommandManager(static)
+    assert mgr.commands() == {"custom_cmd": CLICommand, "custom_shadowed": CLICommand}
+    assert mgr.command_docs() == {
+        "custom_cmd": "Does things.",
+        "custom_shadowed": "Does things.",
+    }
+
+    chain = cmdmgr.ChainLoader(static, cmdmgr.DirectoryLoader(str(tmp_path)))
+    assert chain.load_all() == mgr.commands()
+    assert chain.load_docs() == mgr.command_docs()
+
+
+def test_load_docs_matches_class_docstring(tmp_path):
+    source = 'class CLICommand:\n    """\n    Summary.\n\n        Indented.\n    """\n'
+    (tmp_path / "docs_indented.py").write_text(source)
+    namespace = {}
+    exec(source, namespace)  # pylint: disable=exec-used
+
+    docs = cmdmgr.DirectoryLoader(str(tmp_path)).load_docs()
+    assert docs == {"docs_indented": namespace["CLICommand"].__doc__}
@@ -6,6 +6,9 @@
 
 # pylint: disable=redefined-outer-name,missing-docstring
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from awsrun.runner import AccountRunner, Command
 from awsrun.session import SessionProvider
@@ -50,3 +53,31 @@ def test_backwards_compat_lifecycle_pre_hook(mocker, runner):
     command.pre_hook = mocker.MagicMock()
     runner.run(command, [])
     command.pre_hook.assert_called()
+
+
+def test_all_accounts_processed_when_more_than_submit_window(mocker):
+    session_provider = mocker.MagicMock(spec=SessionProvider)
+    runner = AccountRunner(session_provider, max_workers=2)
+    command = mocker.MagicMock(spec=Command)
+    accts = [str(n) for n in range(100)]
+
+    # Accounts can be an iterator as they are submitted incrementally
+    runner.run(command, iter(accts))
+
+    assert command.execute.call_count == 100
+    collected = [args[0] for args, _ in command.collect_results.call_args_list]
+    assert sorted(collected) == sorted(accts)
+
+
+def test_default_max_workers(mocker):
+    session_provider = mocker.MagicMock(spec=SessionProvider)
+    runner = AccountRunner(session_provider, max_workers=None)
+    command = mocker.MagicMock(spec=Command)
+    accts = [str(n) for n in range(100)]
+    pool = mocker.patch("awsrun.runner.ThreadPoolExecutor", wraps=ThreadPoolExecutor)
+
+    runner.run(command, accts)
+
+    assert command.execute.call_count == 100
+    _, kwargs = pool.call_args
+    assert kwargs["max_workers"] == min(32, (os.cpu_count() or 1) + 4)